@@ -0,0 +1,78 @@
+# Cost of refreshing the file list after one file changes state, against list size:
+# the old update_display (destroy every row, build one per file) versus the keyed,
+# recycled rows of VirtualFileList. Needs a display.
+#
+#   python -m benchmarks.bench_file_list [size ...]
+import sys
+import time
+
+import customtkinter as ctk
+
+from core.file_record import FileRecord
+from ui.file_row import FileRow
+from ui.virtual_list import VirtualFileList
+
+class StubWindow:
+    # The parts of MainWindow a FileRow reads while rendering
+    def get_client_color(self, client_name):
+        return "#4CAF50"
+    
+    def get_elapsed(self, file_data, now=None):
+        return file_data.elapsed_time
+    
+    def format_elapsed(self, elapsed):
+        return f"{int(elapsed // 60):02d}:{int(elapsed % 60):02d}"
+
+def make_items(count):
+    records = [FileRecord(i, f"/work/{i % 7:04d}_CL{i % 7}/image_{i:05d}.psd", f"CL{i % 7}") for i in range(count)]
+    return records, [(record, index) for index, record in enumerate(records)]
+
+def rebuild(root, container, window, items):
+    for widget in container.winfo_children():
+        widget.destroy()
+    for file_data, index in items:
+        row = FileRow(window, container)
+        row.update(file_data, index)
+        row.frame.pack(fill="x", padx=5, pady=2)
+    root.update_idletasks()
+
+def bench(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 200, 500, 1000]
+    root = ctk.CTk()
+    root.geometry("800x600")
+    window = StubWindow()
+    
+    print(f"{'files':>7} {'rebuild ms':>12} {'diff ms':>10}")
+    for size in sizes:
+        records, items = make_items(size)
+        
+        container = ctk.CTkFrame(root)
+        container.pack(fill="both", expand=True)
+        rebuild_ms = bench(lambda: rebuild(root, container, window, items), repeat=3)
+        container.destroy()
+        
+        file_list = VirtualFileList(root, window)
+        file_list.pack(fill="both", expand=True)
+        file_list.set_items(items)
+        root.update()
+        
+        def diff():
+            # One state change, as when a file is started or paused
+            records[0].is_active = not records[0].is_active
+            file_list.set_items(items)
+            root.update_idletasks()
+        
+        diff_ms = bench(diff, repeat=20)
+        file_list.destroy()
+        print(f"{size:>7} {rebuild_ms:>12.1f} {diff_ms:>10.2f}")
+    
+    root.destroy()
+
+if __name__ == "__main__":
+    main()
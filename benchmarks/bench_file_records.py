@@ -0,0 +1,62 @@
+# Memory for tracked files at 50k entries: the old per-file dict (with its derived
+# strings and widget slots) against the FileRecord __slots__ record. Paths are built
+# up front, so only what each layout adds on top of them is counted.
+#
+#   python -m benchmarks.bench_file_records [count]
+import os
+import sys
+import tracemalloc
+
+from core.file_record import FileRecord
+
+def legacy_entry(file_path, client_name):
+    # MainWindow.add_single_file before FileRecord, plus the widget keys rows added later
+    filename = os.path.basename(file_path)
+    short_filename = filename[:25] + "..." if len(filename) > 25 else filename
+    return {
+        'path': file_path,
+        'filename': filename,
+        'short_filename': short_filename,
+        'client': client_name,
+        'display_text': f"{client_name} - {short_filename}",
+        'is_active': False,
+        'is_paused': False,
+        'is_opened': False,
+        'elapsed_time': 0,
+        'timer_id': None,
+        'start_time': None,
+        'completed': False,
+        'pause_count': 0,
+        'idle_time': 0,
+        'frame': None,
+        'name_label': None,
+        'timer_label': None,
+        'pause_btn': None,
+    }
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entries = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size, entries
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # Client names come from the parser as fresh strings, as they do on import
+    inputs = [(f"C:\\Jobs\\{i % 40:04d}_CL\\Retouch\\IMG_{i:06d}_final_version.psd", "".join(["CLIENT_", str(i % 40)]))
+              for i in range(count)]
+    
+    results = [
+        ("dict", measure(lambda: [legacy_entry(path, client) for path, client in inputs])),
+        ("FileRecord", measure(lambda: [FileRecord(i, path, client) for i, (path, client) in enumerate(inputs)])),
+    ]
+    
+    print(f"{count} tracked files")
+    for name, (size, _) in results:
+        print(f"{name:<12} {size / 1e6:>7.1f} MB {size / count:>7.0f} B/file")
+
+if __name__ == "__main__":
+    main()
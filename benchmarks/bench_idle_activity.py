@@ -0,0 +1,77 @@
+# Per-event cost of the activity hook: the old lock + datetime path against the
+# current timestamp store, alone and while a checker thread keeps taking the lock.
+# Also times one check_idle() pass, which now does the interval accounting.
+#
+#   python -m benchmarks.bench_idle_activity [events]
+import sys
+import threading
+import time
+from datetime import datetime
+
+from core.idle_backends import IdleBackend
+from core.idle_detector import IdleDetector
+
+class LegacyActivity:
+    # IdleDetector.on_activity before the rewrite
+    def __init__(self):
+        self.last_activity = datetime.now()
+        self.is_idle = False
+        self.total_idle_time = 0
+        self.idle_start = None
+        self._lock = threading.Lock()
+    
+    def on_activity(self, *args):
+        with self._lock:
+            if self.is_idle and self.idle_start:
+                idle_duration = (datetime.now() - self.idle_start).total_seconds()
+                self.total_idle_time += idle_duration
+                self.idle_start = None
+            
+            self.last_activity = datetime.now()
+            self.is_idle = False
+
+def per_event_ns(hook, events):
+    start = time.perf_counter()
+    for _ in range(events):
+        hook(1, 2)
+    return (time.perf_counter() - start) / events * 1e9
+
+def with_contention(lock, func):
+    # A thread that grabs the lock back to back, standing in for the hotkey listener
+    # and the checker competing with mouse-move events
+    stop = threading.Event()
+    
+    def hammer():
+        while not stop.is_set():
+            with lock:
+                pass
+    
+    thread = threading.Thread(target=hammer, daemon=True)
+    thread.start()
+    try:
+        return func()
+    finally:
+        stop.set()
+        thread.join()
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    legacy = LegacyActivity()
+    detector = IdleDetector(check_interval=1, backend=IdleBackend())
+    
+    print(f"{'hook':<26} {'ns/event':>10} {'contended':>10}")
+    for name, hook, lock in (("legacy (lock + datetime)", legacy.on_activity, legacy._lock),
+                             ("timestamp store", detector.on_activity, detector._lock)):
+        alone = per_event_ns(hook, events)
+        contended = with_contention(lock, lambda: per_event_ns(hook, events))
+        print(f"{name:<26} {alone:>10.0f} {contended:>10.0f}")
+    
+    checks = 20000
+    start = time.perf_counter()
+    for _ in range(checks):
+        detector.check_idle()
+    print(f"check_idle(): {(time.perf_counter() - start) / checks * 1e6:.2f} us per pass, "
+          f"once every {detector.check_interval}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Cost per login of the old Python-level SHA-256 loop against the C-implemented
+# PBKDF2 now used for stored hashes (and scrypt for reference): wall time per
+# verification, cost per iteration, and how many logins a second each allows.
+#
+#   python -m benchmarks.bench_password_kdf [repeat]
+import hashlib
+import os
+import sys
+import time
+
+from core import password_kdf
+
+def per_call(func, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    password = "correct horse battery staple"
+    stored = password_kdf.hash_password(password)
+    legacy_stored = password_kdf.legacy_hash(password, "alice")
+    salt = os.urandom(password_kdf.SALT_BYTES)
+    
+    results = [
+        ("legacy sha256 loop", 1000,
+         per_call(lambda: password_kdf.verify_password(password, legacy_stored, "alice"), repeat)),
+        (password_kdf.ALGORITHM, password_kdf.ITERATIONS,
+         per_call(lambda: password_kdf.verify_password(password, stored), repeat)),
+        ("scrypt n=2^14 r=8", None,
+         per_call(lambda: hashlib.scrypt(password.encode(), salt=salt, n=2 ** 14, r=8, p=1), repeat)),
+    ]
+    
+    print(f"{'scheme':<20} {'iterations':>10} {'ms/login':>9} {'us/iter':>8} {'logins/s':>9}")
+    for name, iterations, seconds in results:
+        per_iteration = f"{seconds / iterations * 1e6:.2f}" if iterations else "-"
+        print(f"{name:<20} {iterations or '-':>10} {seconds * 1000:>9.1f} {per_iteration:>8} {1 / seconds:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Client extraction over a synthetic 100k-path import: the old four-regex parser
+# against PathParser with a cold and a warm per-folder cache.
+#
+#   python -m benchmarks.bench_path_parser [paths] [files per folder]
+import sys
+import time
+
+from tests.test_path_parser import LegacyPathParser, make_corpus
+from utils.client_rules import ClientRuleEngine
+from utils.path_parser import PathParser
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    files_per_folder = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    paths = make_corpus(count, files_per_folder=files_per_folder)
+    
+    legacy = LegacyPathParser()
+    parser = PathParser(rules=ClientRuleEngine(config_file=None))
+    
+    results = [
+        ("legacy", timed(lambda: [legacy.extract_client_from_path(path) for path in paths])),
+        ("cached, cold", timed(lambda: parser.extract_clients(paths))),
+        ("cached, warm", timed(lambda: parser.extract_clients(paths))),
+    ]
+    
+    print(f"{count} paths, {files_per_folder} per folder")
+    for name, seconds in results:
+        print(f"{name:<14} {seconds * 1000:>9.1f} ms {seconds / count * 1e6:>7.2f} us/path")
+
+if __name__ == "__main__":
+    main()
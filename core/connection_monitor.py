@@ -0,0 +1,107 @@
+import bisect
+import random
+import threading
+import time
+from collections import deque
+
+class LatencyHistogram:
+    def __init__(self, bucket_edges_ms=(50, 100, 250, 500, 1000, 2500, 5000), window=200):
+        self.bucket_edges_ms = list(bucket_edges_ms)
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, latency_ms):
+        with self._lock:
+            self.samples.append(latency_ms)
+    
+    def buckets(self):
+        counts = [0] * (len(self.bucket_edges_ms) + 1)
+        with self._lock:
+            for sample in self.samples:
+                counts[bisect.bisect_left(self.bucket_edges_ms, sample)] += 1
+        
+        labels = [f"<={edge}ms" for edge in self.bucket_edges_ms] + [f">{self.bucket_edges_ms[-1]}ms"]
+        return list(zip(labels, counts))
+    
+    def percentile(self, pct):
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+class ConnectionMonitor:
+    def __init__(self, probe_func, on_state_change=None, on_probe=None, interval=30, base_backoff=5, max_backoff=300):
+        self.probe_func = probe_func
+        self.on_state_change = on_state_change
+        self.on_probe = on_probe
+        self.interval = interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.histogram = LatencyHistogram()
+        self.is_online = None
+        self.failures = 0
+        self.last_probe_at = None
+        self.running = False
+        self.thread = None
+        self._wake = threading.Event()
+    
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self._wake.set()
+    
+    def check_now(self):
+        self._wake.set()
+    
+    def next_delay(self):
+        if self.is_online:
+            return self.interval
+        backoff = min(self.max_backoff, self.base_backoff * (2 ** max(0, self.failures - 1)))
+        # Jitter keeps every workstation in the office from retrying in lockstep
+        return backoff * random.uniform(0.5, 1.5)
+    
+    def _run(self):
+        while self.running:
+            self.probe()
+            self._wake.wait(self.next_delay())
+            self._wake.clear()
+    
+    def probe(self):
+        started = time.perf_counter()
+        try:
+            online = bool(self.probe_func())
+        except Exception:
+            online = False
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.last_probe_at = time.time()
+        
+        if online:
+            self.histogram.record(latency_ms)
+            self.failures = 0
+        else:
+            self.failures += 1
+        
+        changed = online != self.is_online
+        self.is_online = online
+        
+        if changed and self.on_state_change:
+            try:
+                self.on_state_change(online)
+            except Exception as e:
+                print(f"Connection state callback error: {e}")
+        
+        if self.on_probe:
+            try:
+                self.on_probe(online)
+            except Exception as e:
+                print(f"Connection probe callback error: {e}")
+        
+        return online
@@ -0,0 +1,77 @@
+import json
+import os
+import threading
+import time
+
+from core import password_kdf
+
+class CredentialCache:
+    # Remembers a salted verifier for recent logins on this machine, so signing in
+    # again (or while offline) does not need a round-trip. Entries expire after ttl.
+    def __init__(self, cache_file="data/credentials.json", ttl=7 * 24 * 3600):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.entries = self.load()
+    
+    def load(self):
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading credential cache: {e}")
+            return {}
+    
+    def save(self):
+        directory = os.path.dirname(self.cache_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self.entries, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.cache_file)
+    
+    def remember(self, username, password, user_data):
+        entry = {
+            'verifier': password_kdf.hash_password(password),
+            'user': {key: value for key, value in user_data.items() if key != 'password'},
+            'expires_at': time.time() + self.ttl
+        }
+        
+        with self._lock:
+            self.entries[username] = entry
+            try:
+                self.save()
+            except Exception as e:
+                print(f"Error saving credential cache: {e}")
+    
+    def verify(self, username, password):
+        # Returns the cached user row on a match, None otherwise
+        with self._lock:
+            entry = self.entries.get(username)
+        if not entry:
+            return None
+        
+        if entry.get('expires_at', 0) < time.time():
+            self.forget(username)
+            return None
+        
+        # Only current-format verifiers are accepted; the legacy scheme is never cached
+        verifier = entry.get('verifier', '')
+        if password_kdf.is_legacy(verifier) or not password_kdf.verify_password(password, verifier):
+            return None
+        return dict(entry['user'])
+    
+    def forget(self, username):
+        with self._lock:
+            if self.entries.pop(username, None) is None:
+                return
+            try:
+                self.save()
+            except Exception as e:
+                print(f"Error saving credential cache: {e}")
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+class EntryCache:
+    # Local copy of the logged-in user's time_entries for reports. Rows are pulled
+    # incrementally past the highest server id seen, so a refresh after the first
+    # one only fetches what was added since. Ids follow insert order, so entries synced
+    # late from the offline queue are picked up even though their completed_at is old.
+    COLUMNS = ('id', 'work_type', 'shift', 'client_name', 'filename', 'time_spent_seconds',
+               'completed_at', 'pause_count', 'total_idle_seconds')
+    
+    def __init__(self, username, db_file="data/entries_cache.db"):
+        self.username = username
+        self.db_file = db_file
+        self._refresh_lock = threading.Lock()
+        
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    username TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    work_type TEXT,
+                    shift TEXT,
+                    client_name TEXT,
+                    filename TEXT,
+                    time_spent_seconds INTEGER,
+                    completed_at TEXT,
+                    pause_count INTEGER,
+                    total_idle_seconds INTEGER,
+                    PRIMARY KEY (username, id)
+                )
+            """)
+            # Covers the report query, so totals never touch the table rows
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_report_idx ON entries "
+                         "(username, completed_at, client_name, shift, time_spent_seconds, total_idle_seconds)")
+    
+    @contextmanager
+    def _connect(self):
+        # A connection per call keeps the cache usable from the UI and the refresh thread
+        conn = sqlite3.connect(self.db_file)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def watermark(self):
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(id) FROM entries WHERE username = ?",
+                               (self.username,)).fetchone()
+        return row[0] if row else None
+    
+    def refresh(self, supabase, batch_size=1000):
+        # Network bound; run on a worker thread. Returns the number of rows pulled.
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        
+        try:
+            rows = supabase.iter_time_entries(employee_name=self.username, after_id=self.watermark(),
+                                              columns=list(self.COLUMNS), order_by='id',
+                                              page_size=batch_size)
+            
+            placeholders = ", ".join("?" for _ in range(len(self.COLUMNS) + 1))
+            sql = f"INSERT OR REPLACE INTO entries (username, {', '.join(self.COLUMNS)}) VALUES ({placeholders})"
+            
+            pulled = 0
+            batch = []
+            with self._connect() as conn:
+                for row in rows:
+                    batch.append((self.username,) + tuple(row.get(column) for column in self.COLUMNS))
+                    if len(batch) >= batch_size:
+                        conn.executemany(sql, batch)
+                        pulled += len(batch)
+                        batch = []
+                if batch:
+                    conn.executemany(sql, batch)
+                    pulled += len(batch)
+            return pulled
+        except Exception as e:
+            print(f"Error refreshing entry cache: {e}")
+            return 0
+        finally:
+            self._refresh_lock.release()
+    
+    def totals(self, start, end, pending=()):
+        # Per-(client, shift) totals for start <= completed_at < end, including entries
+        # still waiting in the offline queue. Returns {(client, shift): [count, seconds, idle]}.
+        start_text, end_text = start.isoformat(), end.isoformat()
+        
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT client_name, shift, COUNT(*), SUM(time_spent_seconds), SUM(total_idle_seconds)
+                FROM entries
+                WHERE username = ? AND completed_at >= ? AND completed_at < ?
+                GROUP BY client_name, shift
+            """, (self.username, start_text, end_text)).fetchall()
+        
+        totals = {}
+        for client_name, shift, count, seconds, idle in rows:
+            totals[(client_name, shift)] = [count, seconds or 0, idle or 0]
+        
+        for entry in pending:
+            if entry.get('employee_name') != self.username:
+                continue
+            completed_at = entry.get('completed_at') or ''
+            if not start_text <= completed_at < end_text:
+                continue
+            key = (entry.get('client_name'), entry.get('shift'))
+            bucket = totals.setdefault(key, [0, 0, 0])
+            bucket[0] += 1
+            bucket[1] += entry.get('time_spent_seconds') or 0
+            bucket[2] += entry.get('total_idle_seconds') or 0
+        
+        return totals
@@ -0,0 +1,41 @@
+import os
+import sys
+
+class FileRecord:
+    # Domain state for one tracked file. Widgets live in ui.file_row.FileRow and only
+    # point at a record while it is on screen, so a record never holds view handles.
+    __slots__ = ('id', 'path', 'client', 'is_active', 'is_paused', 'is_opened',
+                 'elapsed_time', 'start_time', 'completed', 'completing',
+                 'pause_count', 'save_count', 'idle_time')
+    
+    def __init__(self, file_id, path, client):
+        self.id = file_id
+        self.path = path
+        # Thousands of files share a handful of clients, so one string object each
+        self.client = sys.intern(client)
+        self.is_active = False
+        self.is_paused = False
+        self.is_opened = False
+        self.elapsed_time = 0
+        self.start_time = None
+        self.completed = False
+        self.completing = False
+        self.pause_count = 0
+        self.save_count = 0
+        self.idle_time = 0
+    
+    @property
+    def filename(self):
+        return os.path.basename(self.path)
+    
+    @property
+    def short_filename(self):
+        filename = self.filename
+        return filename[:25] + "..." if len(filename) > 25 else filename
+    
+    @property
+    def display_text(self):
+        return f"{self.client} - {self.short_filename}"
+    
+    def __repr__(self):
+        return f"FileRecord(id={self.id}, path={self.path!r}, client={self.client!r})"
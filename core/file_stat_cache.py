@@ -0,0 +1,74 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class DirectoryStatCache:
+    def __init__(self, max_workers=2):
+        self.index = {}
+        self._lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stat-cache")
+    
+    def stem_index(self, directory):
+        # One scandir pass per directory, reused until the directory's own mtime changes
+        dir_mtime = os.stat(directory).st_mtime_ns
+        
+        with self._lock:
+            cached = self.index.get(directory)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+        
+        stems = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stems.setdefault(os.path.splitext(entry.name)[0], []).append(entry.name)
+                except OSError:
+                    continue
+        
+        with self._lock:
+            self.index[directory] = (dir_mtime, stems)
+        return stems
+    
+    def latest_mtime(self, file_path):
+        directory = os.path.dirname(file_path) or "."
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        
+        names = self.stem_index(directory).get(stem, [])
+        paths = [file_path] + [os.path.join(directory, name) for name in names]
+        
+        # Saving in place does not touch the directory mtime, so the few siblings are stat'ed fresh
+        latest = None
+        for path in paths:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if latest is None or mtime > latest:
+                latest = mtime
+        return latest
+    
+    def was_modified_within(self, file_path, seconds=60):
+        try:
+            if not os.path.exists(file_path):
+                return False
+            
+            latest = self.latest_mtime(file_path)
+            return latest is not None and time.time() - latest <= seconds
+        except Exception as e:
+            print(f"Error checking file modification: {e}")
+            return True
+    
+    def submit(self, file_path, seconds=60):
+        return self.executor.submit(self.was_modified_within, file_path, seconds)
+    
+    def invalidate(self, directory=None):
+        with self._lock:
+            if directory is None:
+                self.index.clear()
+            else:
+                self.index.pop(directory, None)
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,271 @@
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+
+class FileWatcher:
+    def __init__(self, poll_interval=5, use_inotify=True):
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith('linux')
+        self.subscribers = {}
+        self.watched_dirs = {}
+        # Folders inotify could not watch (limit reached, folder gone); their keys get no baseline
+        self.failed_dirs = set()
+        self.last_saved = {}
+        self.save_counts = {}
+        self.pending = queue.Queue()
+        self._wake = threading.Event()
+        self.running = False
+        self.thread = None
+        self.libc = None
+        self.inotify_fd = None
+        self.wd_to_dir = {}
+        self.wake_pipe = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key_for(file_path):
+        # Exports share the working file's stem, so saves are tracked per (folder, stem)
+        directory = os.path.normcase(os.path.abspath(os.path.dirname(file_path)))
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        return directory, stem
+    
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        
+        if self.use_inotify:
+            try:
+                self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+                fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+                if fd < 0:
+                    raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+                self.inotify_fd = fd
+                self.wake_pipe = os.pipe()
+            except Exception as e:
+                print(f"inotify unavailable, polling for saves instead: {e}")
+                self.inotify_fd = None
+        
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.running = False
+        self._notify()
+    
+    def _notify(self):
+        self._wake.set()
+        if self.wake_pipe is not None:
+            try:
+                os.write(self.wake_pipe[1], b'x')
+            except OSError:
+                pass
+    
+    def watch(self, file_path):
+        key = self.key_for(file_path)
+        with self._lock:
+            count = self.subscribers.get(key, 0) + 1
+            self.subscribers[key] = count
+        # a.psd and a.tif share a key; folder watches count keys, so only the first one queues
+        if count == 1:
+            self.pending.put(('watch', key))
+            self._notify()
+    
+    def unwatch(self, file_path):
+        key = self.key_for(file_path)
+        with self._lock:
+            count = self.subscribers.get(key, 0) - 1
+            if count > 0:
+                self.subscribers[key] = count
+                return
+            if count < 0:
+                return
+            self.subscribers.pop(key, None)
+            self.last_saved.pop(key, None)
+            self.save_counts.pop(key, None)
+        self.pending.put(('unwatch', key))
+        self._notify()
+    
+    def get_last_saved(self, file_path):
+        with self._lock:
+            return self.last_saved.get(self.key_for(file_path))
+    
+    def get_save_count(self, file_path):
+        with self._lock:
+            return self.save_counts.get(self.key_for(file_path), 0)
+    
+    def was_saved_within(self, file_path, seconds=60):
+        # None means the watcher has no baseline yet and the caller should stat instead
+        key = self.key_for(file_path)
+        with self._lock:
+            if key not in self.subscribers or key not in self.last_saved:
+                return None
+            last_saved = self.last_saved[key]
+        return last_saved is not None and time.time() - last_saved <= seconds
+    
+    def _record_save(self, key, saved_at):
+        with self._lock:
+            if key not in self.subscribers:
+                return
+            previous = self.last_saved.get(key)
+            if previous is not None and saved_at <= previous:
+                return
+            self.last_saved[key] = saved_at
+            self.save_counts[key] = self.save_counts.get(key, 0) + 1
+    
+    def _process_pending(self):
+        new_stems = {}
+        while True:
+            try:
+                action, key = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            
+            directory, stem = key
+            if action == 'watch':
+                self.watched_dirs[directory] = self.watched_dirs.get(directory, 0) + 1
+                if self.watched_dirs[directory] == 1 and not self._add_dir_watch(directory):
+                    self.failed_dirs.add(directory)
+                new_stems.setdefault(directory, set()).add(stem)
+            else:
+                count = self.watched_dirs.get(directory, 0) - 1
+                if count > 0:
+                    self.watched_dirs[directory] = count
+                else:
+                    self.watched_dirs.pop(directory, None)
+                    self.failed_dirs.discard(directory)
+                    self._remove_dir_watch(directory)
+        
+        # Baselines are taken here, off the UI thread, with one listing per folder; they are
+        # not counted as saves. A folder without a working watch gets none, so callers stat.
+        for directory, stems in new_stems.items():
+            if directory in self.failed_dirs:
+                continue
+            latest = self._scan_directory(directory, stems)
+            with self._lock:
+                for stem in stems:
+                    key = (directory, stem)
+                    if key in self.subscribers and key not in self.last_saved:
+                        self.last_saved[key] = latest.get(stem)
+    
+    def _scan_directory(self, directory, stems):
+        # Newest mtime per watched stem from a single scandir; exports share the working file's stem
+        latest = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    stem = os.path.splitext(entry.name)[0]
+                    if stem not in stems:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if stem not in latest or mtime > latest[stem]:
+                        latest[stem] = mtime
+        except OSError:
+            pass
+        return latest
+    
+    def _add_dir_watch(self, directory):
+        if self.inotify_fd is None:
+            # Polling covers every folder
+            return True
+        wd = self.libc.inotify_add_watch(self.inotify_fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            print(f"Could not watch {directory}: {os.strerror(ctypes.get_errno())}")
+            return False
+        self.wd_to_dir[wd] = directory
+        return True
+    
+    def _drop_directory(self, directory):
+        # The folder's watch is gone, so its keys can no longer say "not saved"
+        self.failed_dirs.add(directory)
+        with self._lock:
+            for key in [key for key in self.last_saved if key[0] == directory]:
+                del self.last_saved[key]
+    
+    def _remove_dir_watch(self, directory):
+        if self.inotify_fd is None:
+            return
+        for wd, watched in list(self.wd_to_dir.items()):
+            if watched == directory:
+                self.libc.inotify_rm_watch(self.inotify_fd, wd)
+                del self.wd_to_dir[wd]
+    
+    def _run(self):
+        while self.running:
+            self._process_pending()
+            if self.inotify_fd is not None:
+                self._wait_inotify()
+            else:
+                self._poll()
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+        
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+            for fd in self.wake_pipe:
+                os.close(fd)
+            self.wake_pipe = None
+    
+    def _wait_inotify(self):
+        # The wake pipe lets watch()/stop() interrupt the wait immediately
+        readable, _, _ = select.select([self.inotify_fd, self.wake_pipe[0]], [], [], 1.0)
+        if self.wake_pipe[0] in readable:
+            os.read(self.wake_pipe[0], 4096)
+        if self.inotify_fd not in readable:
+            return
+        
+        try:
+            buffer = os.read(self.inotify_fd, 65536)
+        except BlockingIOError:
+            return
+        
+        now = time.time()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(buffer, offset)
+            name = buffer[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+            
+            if mask & IN_IGNORED:
+                # The kernel removed the watch (folder deleted or unmounted)
+                directory = self.wd_to_dir.pop(wd, None)
+                if directory is not None and directory in self.watched_dirs:
+                    self._drop_directory(directory)
+                continue
+            
+            directory = self.wd_to_dir.get(wd)
+            if directory is None or not name:
+                continue
+            stem = os.path.splitext(os.fsdecode(name))[0]
+            self._record_save((directory, stem), now)
+    
+    def _poll(self):
+        # One listing per watched folder rather than a stat per tracked file and sibling,
+        # which matters for thousands of files on a network share
+        stems_by_dir = {}
+        with self._lock:
+            for directory, stem in self.last_saved:
+                stems_by_dir.setdefault(directory, set()).add(stem)
+        
+        for directory, stems in stems_by_dir.items():
+            for stem, mtime in self._scan_directory(directory, stems).items():
+                self._record_save((directory, stem), mtime)
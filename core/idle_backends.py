@@ -0,0 +1,151 @@
+import ctypes
+import ctypes.util
+import os
+
+class IdleBackend:
+    name = "base"
+    
+    @classmethod
+    def is_available(cls):
+        return False
+    
+    def start(self, on_activity):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def seconds_since_input(self):
+        # None means the backend pushes activity through on_activity instead
+        return None
+
+class PynputIdleBackend(IdleBackend):
+    name = "pynput"
+    
+    def __init__(self):
+        self.mouse_listener = None
+        self.keyboard_listener = None
+    
+    @classmethod
+    def is_available(cls):
+        return True
+    
+    def start(self, on_activity):
+        try:
+            from pynput import mouse, keyboard
+            
+            self.mouse_listener = mouse.Listener(
+                on_move=on_activity,
+                on_click=on_activity,
+                on_scroll=on_activity
+            )
+            self.keyboard_listener = keyboard.Listener(
+                on_press=on_activity
+            )
+            
+            self.mouse_listener.daemon = True
+            self.keyboard_listener.daemon = True
+            
+            self.mouse_listener.start()
+            self.keyboard_listener.start()
+        except Exception as e:
+            print(f"Could not start activity listeners: {e}")
+    
+    def stop(self):
+        try:
+            if self.mouse_listener:
+                self.mouse_listener.stop()
+            if self.keyboard_listener:
+                self.keyboard_listener.stop()
+        except Exception:
+            pass
+
+class WindowsIdleBackend(IdleBackend):
+    name = "windows"
+    
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint)]
+    
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.kernel32 = ctypes.windll.kernel32
+        self.info = self.LASTINPUTINFO()
+        self.info.cbSize = ctypes.sizeof(self.info)
+    
+    @classmethod
+    def is_available(cls):
+        return os.name == 'nt'
+    
+    def seconds_since_input(self):
+        if not self.user32.GetLastInputInfo(ctypes.byref(self.info)):
+            return None
+        # Both counters are 32-bit milliseconds since boot and wrap after ~49 days
+        elapsed_ms = (self.kernel32.GetTickCount() - self.info.dwTime) & 0xFFFFFFFF
+        return elapsed_ms / 1000.0
+
+class X11IdleBackend(IdleBackend):
+    name = "x11"
+    
+    class XScreenSaverInfo(ctypes.Structure):
+        _fields_ = [
+            ('window', ctypes.c_ulong),
+            ('state', ctypes.c_int),
+            ('kind', ctypes.c_int),
+            ('til_or_since', ctypes.c_ulong),
+            ('idle', ctypes.c_ulong),
+            ('eventMask', ctypes.c_ulong)
+        ]
+    
+    def __init__(self):
+        self.xlib = ctypes.cdll.LoadLibrary(ctypes.util.find_library('X11'))
+        self.xss = ctypes.cdll.LoadLibrary(ctypes.util.find_library('Xss'))
+        
+        self.xlib.XOpenDisplay.restype = ctypes.c_void_p
+        self.xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        self.xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        self.xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        self.xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        self.xss.XScreenSaverAllocInfo.restype = ctypes.POINTER(self.XScreenSaverInfo)
+        self.xss.XScreenSaverQueryInfo.argtypes = [ctypes.c_void_p, ctypes.c_ulong,
+                                                   ctypes.POINTER(self.XScreenSaverInfo)]
+        
+        self.display = self.xlib.XOpenDisplay(None)
+        if not self.display:
+            raise OSError("Cannot open X display")
+        self.root = self.xlib.XDefaultRootWindow(self.display)
+        self.info = self.xss.XScreenSaverAllocInfo()
+    
+    @classmethod
+    def is_available(cls):
+        return (os.name == 'posix' and bool(os.environ.get('DISPLAY'))
+                and bool(ctypes.util.find_library('X11')) and bool(ctypes.util.find_library('Xss')))
+    
+    def seconds_since_input(self):
+        if not self.display:
+            return None
+        if not self.xss.XScreenSaverQueryInfo(self.display, self.root, self.info):
+            return None
+        return self.info.contents.idle / 1000.0
+    
+    def stop(self):
+        if self.display:
+            self.xlib.XCloseDisplay(self.display)
+            self.display = None
+
+# Tried in order; OS idle counters first, global input hooks as the fallback
+BACKENDS = [WindowsIdleBackend, X11IdleBackend, PynputIdleBackend]
+
+def register_backend(backend_class, first=True):
+    if first:
+        BACKENDS.insert(0, backend_class)
+    else:
+        BACKENDS.append(backend_class)
+
+def get_default_backend():
+    for backend_class in BACKENDS:
+        try:
+            if backend_class.is_available():
+                return backend_class()
+        except Exception as e:
+            print(f"Idle backend {backend_class.name} unavailable: {e}")
+    return PynputIdleBackend()
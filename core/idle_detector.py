@@ -1,103 +1,134 @@
 import threading
 import time
-from datetime import datetime
+
+from core.idle_backends import get_default_backend
+from core.idle_ledger import IdleLedger
 
 class IdleDetector:
-    def __init__(self, idle_threshold=60, callback=None):
+    def __init__(self, idle_threshold=60, callback=None, check_interval=5, backend=None):
         self.idle_threshold = idle_threshold
         self.callback = callback
-        self.last_activity = datetime.now()
+        self.check_interval = check_interval
+        self.backend = backend
+        self.last_activity = time.monotonic()
         self.is_idle = False
         self.total_idle_time = 0
         self.idle_start = None
+        self.ledger = IdleLedger()
         self.running = False
-        self.mouse_listener = None
-        self.keyboard_listener = None
         self.check_thread = None
+        self._stop_event = threading.Event()
         self._lock = threading.Lock()
     
     def on_activity(self, *args):
-        with self._lock:
-            if self.is_idle and self.idle_start:
-                idle_duration = (datetime.now() - self.idle_start).total_seconds()
-                self.total_idle_time += idle_duration
-                self.idle_start = None
-            
-            self.last_activity = datetime.now()
-            self.is_idle = False
+        # Called for every input event: a single attribute store, no lock, no datetime
+        self.last_activity = time.monotonic()
     
     def start(self):
         self.running = True
-        self.last_activity = datetime.now()
+        self._stop_event.clear()
+        self.last_activity = time.monotonic()
         
-        try:
-            from pynput import mouse, keyboard
-            
-            self.mouse_listener = mouse.Listener(
-                on_move=self.on_activity,
-                on_click=self.on_activity,
-                on_scroll=self.on_activity
-            )
-            self.keyboard_listener = keyboard.Listener(
-                on_press=self.on_activity
-            )
-            
-            self.mouse_listener.daemon = True
-            self.keyboard_listener.daemon = True
-            
-            self.mouse_listener.start()
-            self.keyboard_listener.start()
-        except Exception as e:
-            print(f"Could not start activity listeners: {e}")
+        if self.backend is None:
+            self.backend = get_default_backend()
+        self.backend.start(self.on_activity)
         
         self.check_thread = threading.Thread(target=self._check_idle_loop, daemon=True)
         self.check_thread.start()
     
     def _check_idle_loop(self):
         while self.running:
-            time.sleep(5)
+            self._stop_event.wait(self.check_interval)
             
             if not self.running:
                 break
             
-            with self._lock:
-                idle_seconds = (datetime.now() - self.last_activity).total_seconds()
-                
-                if idle_seconds >= self.idle_threshold and not self.is_idle:
-                    self.is_idle = True
-                    self.idle_start = datetime.now()
-                    if self.callback:
-                        try:
-                            self.callback('idle_start')
-                        except Exception:
-                            pass
+            self.check_idle()
     
-    def stop(self):
-        self.running = False
+    def check_idle(self):
+        became_idle = False
         
         with self._lock:
-            if self.is_idle and self.idle_start:
-                idle_duration = (datetime.now() - self.idle_start).total_seconds()
-                self.total_idle_time += idle_duration
+            self._close_idle_interval()
+            
+            idle_seconds = time.monotonic() - self.last_activity
+            if idle_seconds >= self.idle_threshold and not self.is_idle:
+                self.is_idle = True
+                self.idle_start = time.monotonic()
+                self.ledger.open_span(self.idle_start)
+                became_idle = True
         
+        if became_idle and self.callback:
+            try:
+                self.callback('idle_start')
+            except Exception:
+                pass
+    
+    def _poll_backend(self):
+        if self.backend is None:
+            return
         try:
-            if self.mouse_listener:
-                self.mouse_listener.stop()
-            if self.keyboard_listener:
-                self.keyboard_listener.stop()
+            idle_seconds = self.backend.seconds_since_input()
         except Exception:
-            pass
+            idle_seconds = None
+        if idle_seconds is not None:
+            self.last_activity = time.monotonic() - idle_seconds
+    
+    def _close_idle_interval(self):
+        # Activity since idle_start ends the idle interval at the moment of that activity
+        self._poll_backend()
+        last_activity = self.last_activity
+        if self.is_idle and self.idle_start is not None and last_activity > self.idle_start:
+            self.total_idle_time += last_activity - self.idle_start
+            self.ledger.close_span(last_activity)
+            self.idle_start = None
+            self.is_idle = False
+    
+    def stop(self):
+        self.running = False
+        self._stop_event.set()
+        
+        with self._lock:
+            self._close_idle_interval()
+            if self.is_idle and self.idle_start is not None:
+                now = time.monotonic()
+                self.total_idle_time += now - self.idle_start
+                self.ledger.close_span(now)
+                self.idle_start = None
+                self.is_idle = False
+            
+            if self.backend:
+                self.backend.stop()
     
     def get_total_idle_time(self):
         with self._lock:
+            self._close_idle_interval()
             total = self.total_idle_time
-            if self.is_idle and self.idle_start:
-                total += (datetime.now() - self.idle_start).total_seconds()
+            if self.is_idle and self.idle_start is not None:
+                total += time.monotonic() - self.idle_start
             return int(total)
     
+    def set_active_file(self, file_id):
+        with self._lock:
+            self._close_idle_interval()
+            self.ledger.set_active_file(file_id, time.monotonic())
+    
+    def get_file_idle_time(self, file_id):
+        with self._lock:
+            self._close_idle_interval()
+            return int(self.ledger.total_for(file_id, time.monotonic()))
+    
+    def discard_file(self, file_id):
+        with self._lock:
+            self.ledger.discard(file_id)
+    
+    def clear_files(self):
+        with self._lock:
+            self.ledger.clear()
+    
     def reset(self):
         with self._lock:
             self.total_idle_time = 0
             self.idle_start = None
             self.is_idle = False
-            self.last_activity = datetime.now()
+            self.last_activity = time.monotonic()
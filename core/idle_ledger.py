@@ -0,0 +1,66 @@
+from array import array
+
+class IdleLedger:
+    def __init__(self):
+        # Closed idle spans as parallel typed arrays: (file id, start, end) in monotonic seconds
+        self.file_ids = array('q')
+        self.starts = array('d')
+        self.ends = array('d')
+        self.totals = {}
+        self.active_file = None
+        self.open_file = None
+        self.open_start = None
+    
+    def set_active_file(self, file_id, now):
+        if file_id == self.active_file:
+            return
+        
+        # An idle span that straddles a file switch is split between the two files
+        span_open = self.open_start is not None
+        if span_open:
+            self.close_span(now)
+        self.active_file = file_id
+        if span_open:
+            self.open_span(now)
+    
+    def open_span(self, start):
+        if self.active_file is None or self.open_start is not None:
+            return
+        self.open_file = self.active_file
+        self.open_start = start
+    
+    def close_span(self, end):
+        if self.open_start is None:
+            return
+        
+        duration = max(0.0, end - self.open_start)
+        self.file_ids.append(self.open_file)
+        self.starts.append(self.open_start)
+        self.ends.append(self.open_start + duration)
+        self.totals[self.open_file] = self.totals.get(self.open_file, 0.0) + duration
+        
+        self.open_file = None
+        self.open_start = None
+    
+    def total_for(self, file_id, now=None):
+        total = self.totals.get(file_id, 0.0)
+        if now is not None and self.open_file == file_id and self.open_start is not None:
+            total += max(0.0, now - self.open_start)
+        return total
+    
+    def discard(self, file_id):
+        self.totals.pop(file_id, None)
+        if self.open_file == file_id:
+            self.open_file = None
+            self.open_start = None
+    
+    def spans_for(self, file_id):
+        return [(self.starts[i], self.ends[i]) for i in range(len(self.file_ids)) if self.file_ids[i] == file_id]
+    
+    def clear(self):
+        self.file_ids = array('q')
+        self.starts = array('d')
+        self.ends = array('d')
+        self.totals = {}
+        self.open_file = None
+        self.open_start = None
@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+class RecentKeys:
+    # Bounded set of entry ids known to be on the server; the oldest ids fall out first
+    def __init__(self, max_size=2000):
+        self.max_size = max_size
+        self.keys = OrderedDict()
+    
+    def __contains__(self, key):
+        return key in self.keys
+    
+    def __iter__(self):
+        return iter(self.keys)
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def add(self, key):
+        self.keys[key] = None
+        self.keys.move_to_end(key)
+        while len(self.keys) > self.max_size:
+            self.keys.popitem(last=False)
+
+class OfflineJournal:
+    def __init__(self, journal_file="data/offline_queue.jsonl", legacy_file="data/offline_queue.json"):
+        self.journal_file = journal_file
+        self.legacy_file = legacy_file
+        self.entries = {}
+        self.recent_acks = RecentKeys()
+        self.acked_since_compact = 0
+        self._lock = threading.Lock()
+        
+        self.load()
+        self.migrate_legacy_queue()
+    
+    def load(self):
+        self.entries = {}
+        if not os.path.exists(self.journal_file):
+            return
+        
+        try:
+            with open(self.journal_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-append
+                        continue
+                    
+                    if record.get('op') == 'add':
+                        self.entries[record['id']] = record['entry']
+                    elif record.get('op') == 'ack':
+                        for entry_id in record['ids']:
+                            self.recent_acks.add(entry_id)
+                            if self.entries.pop(entry_id, None) is not None:
+                                self.acked_since_compact += 1
+            self._repair_torn_tail()
+        except Exception as e:
+            print(f"Error loading offline journal: {e}")
+    
+    def _repair_torn_tail(self):
+        with open(self.journal_file, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    
+    def migrate_legacy_queue(self):
+        if not os.path.exists(self.legacy_file):
+            return
+        
+        try:
+            with open(self.legacy_file, 'r') as f:
+                legacy_entries = json.load(f)
+        except Exception as e:
+            print(f"Error reading legacy offline queue: {e}")
+            return
+        
+        if legacy_entries:
+            try:
+                self._write_records([self._add_record(entry) for entry in legacy_entries])
+            except Exception as e:
+                print(f"Error migrating legacy offline queue: {e}")
+                return
+            print(f"Migrated {len(legacy_entries)} entries to offline journal")
+        
+        try:
+            os.replace(self.legacy_file, self.legacy_file + ".migrated")
+        except OSError as e:
+            print(f"Error retiring legacy offline queue: {e}")
+    
+    def _add_record(self, entry):
+        # The entry's own idempotency key doubles as the journal id, so queueing the
+        # same entry twice keeps a single copy
+        entry = dict(entry)
+        entry.setdefault('entry_id', str(uuid.uuid4()))
+        entry.setdefault('_queued_at', datetime.now().isoformat())
+        entry_id = entry['entry_id']
+        self.entries[entry_id] = entry
+        return {'op': 'add', 'id': entry_id, 'entry': entry}
+    
+    def _write_records(self, records):
+        os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+        with open(self.journal_file, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def append(self, entry):
+        with self._lock:
+            entry_id = entry.get('entry_id')
+            if entry_id and (entry_id in self.recent_acks or entry_id in self.entries):
+                # Already delivered or already queued
+                return entry_id
+            
+            record = self._add_record(entry)
+            try:
+                self._write_records([record])
+            except Exception as e:
+                print(f"Error saving offline queue: {e}")
+            return record['id']
+    
+    def pending(self):
+        with self._lock:
+            return [(entry_id, dict(entry)) for entry_id, entry in self.entries.items()]
+    
+    def count(self, exclude=()):
+        with self._lock:
+            return len(self.entries) - sum(1 for entry_id in exclude if entry_id in self.entries)
+    
+    def is_acked(self, entry_id):
+        return entry_id in self.recent_acks
+    
+    def ack(self, entry_ids):
+        with self._lock:
+            acked = [entry_id for entry_id in entry_ids if entry_id in self.entries]
+            if not acked:
+                return
+            
+            self._write_records([{'op': 'ack', 'ids': acked}])
+            for entry_id in acked:
+                del self.entries[entry_id]
+                self.recent_acks.add(entry_id)
+            self.acked_since_compact += len(acked)
+    
+    def compact(self, min_acked=1):
+        with self._lock:
+            if self.acked_since_compact < min_acked:
+                return
+            
+            tmp_file = self.journal_file + ".tmp"
+            try:
+                with open(tmp_file, 'w') as f:
+                    for entry_id, entry in self.entries.items():
+                        f.write(json.dumps({'op': 'add', 'id': entry_id, 'entry': entry}) + "\n")
+                    # Recent acks survive compaction so a replayed entry is still recognised
+                    if self.recent_acks:
+                        f.write(json.dumps({'op': 'ack', 'ids': list(self.recent_acks)}) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.journal_file)
+                self.acked_since_compact = 0
+            except Exception as e:
+                print(f"Error compacting offline journal: {e}")
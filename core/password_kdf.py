@@ -0,0 +1,50 @@
+import hashlib
+import hmac
+import os
+
+# Stored hashes look like "pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>".
+# Anything without the prefix is a legacy hash from the old SHA-256 loop.
+ALGORITHM = "pbkdf2_sha256"
+ITERATIONS = 200000
+SALT_BYTES = 16
+
+LEGACY_BASE_SALT = "schl_time_tracker_2024"
+
+def legacy_hash(password, username=""):
+    # The original scheme, kept only to verify and migrate existing accounts
+    user_salt = hashlib.sha256((username + LEGACY_BASE_SALT).encode()).hexdigest()[:16]
+    combined = password + user_salt + LEGACY_BASE_SALT
+    for _ in range(1000):
+        combined = hashlib.sha256(combined.encode()).hexdigest()
+    return combined
+
+def hash_password(password, iterations=ITERATIONS, salt=None):
+    if salt is None:
+        salt = os.urandom(SALT_BYTES)
+    derived = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+    return f"{ALGORITHM}${iterations}${salt.hex()}${derived.hex()}"
+
+def is_legacy(stored_hash):
+    return not stored_hash or not stored_hash.startswith(ALGORITHM + "$")
+
+def verify_password(password, stored_hash, username=""):
+    if not stored_hash:
+        return False
+    
+    if is_legacy(stored_hash):
+        return hmac.compare_digest(legacy_hash(password, username), stored_hash)
+    
+    try:
+        _, iterations, salt, expected = stored_hash.split("$")
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode(), bytes.fromhex(salt), int(iterations))
+    except ValueError:
+        return False
+    return hmac.compare_digest(derived.hex(), expected)
+
+def needs_rehash(stored_hash, iterations=ITERATIONS):
+    if is_legacy(stored_hash):
+        return True
+    try:
+        return int(stored_hash.split("$")[1]) < iterations
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,292 @@
+import bisect
+import time
+from contextlib import contextmanager
+
+class SortedIndex:
+    # Sorted list of sequence numbers with O(log n) lookup of the next entry
+    def __init__(self):
+        self.keys = []
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def add(self, key):
+        position = bisect.bisect_left(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            self.keys.insert(position, key)
+    
+    def discard(self, key):
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            del self.keys[position]
+    
+    def first(self, after=None):
+        position = 0 if after is None else bisect.bisect_right(self.keys, after)
+        if position < len(self.keys):
+            return self.keys[position]
+        return None
+    
+    def clear(self):
+        self.keys = []
+
+class WorkSession:
+    # Tracked files and their timer state, independent of the UI. Records are kept
+    # by id in insertion order, and each one also sits in the scheduling indices
+    # for its current state, so picking the next file never walks the whole list.
+    def __init__(self, clock=time.monotonic, store=None):
+        self.clock = clock
+        self.store = store
+        self.records = {}
+        self.seq = {}
+        self.by_seq = {}
+        self.active_id = None
+        self._saved_active_id = None
+        self.next_id = 1
+        self.next_seq = 1
+        self._batch_depth = 0
+        self._dirty = {}
+        
+        self.unopened = SortedIndex()       # not completed, never opened
+        self.opened_waiting = SortedIndex() # not completed, opened, not started
+        self.waiting = SortedIndex()        # not completed, not started
+        self.paused = SortedIndex()         # started and paused
+        self.running = set()                # started and counting
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records.values())
+    
+    def get(self, file_id):
+        return self.records.get(file_id)
+    
+    def new_id(self):
+        file_id = self.next_id
+        self.next_id += 1
+        return file_id
+    
+    def add(self, file_data, seq=None):
+        file_id = file_data.id
+        if seq is None:
+            seq = self.next_seq
+        self.next_seq = max(self.next_seq, seq + 1)
+        self.next_id = max(self.next_id, file_id + 1)
+        
+        self.records[file_id] = file_data
+        self.seq[file_id] = seq
+        self.by_seq[seq] = file_id
+        self._reindex(file_id)
+        self._persist(file_data)
+        return file_data
+    
+    def restore(self, store):
+        # Loads the checkpointed list without writing it back, then persists from here on.
+        # The current file comes back paused or running; checkpoints from before the
+        # current id was stored only know the file that was running.
+        self.store = None
+        self._saved_active_id = store.load_active()
+        running_id = None
+        for record, seq, was_running in store.load():
+            self.add(record, seq)
+            if was_running:
+                running_id = record.id
+        current = self.records.get(self._saved_active_id)
+        self.active_id = current.id if current and current.is_active else running_id
+        self.store = store
+        return len(self.records)
+    
+    @contextmanager
+    def batch(self):
+        # Bulk adds are written in one executemany instead of a commit per file
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+    
+    def _persist(self, *records):
+        if self.store is None:
+            return
+        for record in records:
+            self._dirty[record.id] = record
+        if self._batch_depth == 0:
+            self._flush()
+    
+    def _flush(self):
+        if self.store is None:
+            self._dirty.clear()
+            return
+        
+        dirty = list(self._dirty.values())
+        self._dirty.clear()
+        
+        saved = []
+        done = []
+        for record in dirty:
+            if record.completed or self.records.get(record.id) is not record:
+                done.append(record.id)
+            else:
+                saved.append((record, self.seq[record.id], self.elapsed(record)))
+        self.store.save(saved)
+        if done:
+            self.store.delete(done)
+        if self.active_id != self._saved_active_id:
+            self.store.save_active(self.active_id)
+            self._saved_active_id = self.active_id
+    
+    def checkpoint(self):
+        # Running timers only change with the clock, so they are saved periodically
+        self._persist(*(self.records[file_id] for file_id in self.running))
+    
+    def save_all(self):
+        self._persist(*(record for record in self.records.values() if not record.completed))
+    
+    def remove(self, file_data):
+        file_id = file_data.id
+        if self.records.get(file_id) is not file_data:
+            return False
+        
+        self._unindex(file_id)
+        del self.records[file_id]
+        del self.by_seq[self.seq.pop(file_id)]
+        if self.active_id == file_id:
+            self.active_id = None
+        self._persist(file_data)
+        return True
+    
+    def clear(self):
+        self.records.clear()
+        self.seq.clear()
+        self.by_seq.clear()
+        self.active_id = None
+        for index in (self.unopened, self.opened_waiting, self.waiting, self.paused):
+            index.clear()
+        self.running.clear()
+        self._dirty.clear()
+        self._saved_active_id = None
+        if self.store is not None:
+            self.store.clear()
+    
+    def _unindex(self, file_id):
+        seq = self.seq[file_id]
+        for index in (self.unopened, self.opened_waiting, self.waiting, self.paused):
+            index.discard(seq)
+        self.running.discard(file_id)
+    
+    def _reindex(self, file_id):
+        self._unindex(file_id)
+        file_data = self.records[file_id]
+        if file_data.completed:
+            return
+        
+        seq = self.seq[file_id]
+        if not file_data.is_opened:
+            self.unopened.add(seq)
+        if not file_data.is_active:
+            self.waiting.add(seq)
+            if file_data.is_opened:
+                self.opened_waiting.add(seq)
+        elif file_data.is_paused:
+            self.paused.add(seq)
+        else:
+            self.running.add(file_id)
+    
+    def _record_at(self, seq):
+        if seq is None:
+            return None
+        return self.records[self.by_seq[seq]]
+    
+    def active(self):
+        if self.active_id is None:
+            return None
+        return self.records.get(self.active_id)
+    
+    def elapsed(self, file_data, now=None):
+        elapsed = file_data.elapsed_time
+        if file_data.is_active and not file_data.is_paused and file_data.start_time is not None:
+            elapsed += (now if now is not None else self.clock()) - file_data.start_time
+        return elapsed
+    
+    def mark_opened(self, file_data):
+        file_data.is_opened = True
+        self._reindex(file_data.id)
+        self._persist(file_data)
+    
+    def start(self, file_data):
+        now = self.clock()
+        changed = [file_data]
+        # Only running files need their time banked; paused ones already have it
+        for other_id in list(self.running):
+            if other_id != file_data.id:
+                other = self.records[other_id]
+                other.elapsed_time = self.elapsed(other, now)
+                other.is_paused = True
+                other.start_time = None
+                self._reindex(other_id)
+                changed.append(other)
+        
+        file_data.is_active = True
+        file_data.is_paused = False
+        file_data.start_time = now
+        self.active_id = file_data.id
+        self._reindex(file_data.id)
+        self._persist(*changed)
+    
+    def toggle_pause(self, file_data):
+        if not file_data.is_active:
+            return False
+        
+        if file_data.is_paused:
+            file_data.is_paused = False
+            file_data.start_time = self.clock()
+        else:
+            file_data.elapsed_time = self.elapsed(file_data)
+            file_data.is_paused = True
+            file_data.start_time = None
+            file_data.pause_count += 1
+        self._reindex(file_data.id)
+        self._persist(file_data)
+        return True
+    
+    def complete(self, file_data):
+        total_time = self.elapsed(file_data)
+        file_data.elapsed_time = total_time
+        file_data.start_time = None
+        file_data.completed = True
+        file_data.is_active = False
+        self._reindex(file_data.id)
+        self._persist(file_data)
+        return total_time
+    
+    def next_unopened(self):
+        return self._record_at(self.unopened.first())
+    
+    def next_to_start(self):
+        # Opened files waiting to start come first, then the first file not yet opened
+        return self._record_at(self.opened_waiting.first()) or self.next_unopened()
+    
+    def next_after(self, file_data):
+        # Returns (record, open_first): the next opened file after it (opened again),
+        # the next paused file after it, the first paused file, then the first file
+        # not started at all
+        seq = self.seq.get(file_data.id)
+        candidate = self._record_at(self.opened_waiting.first(after=seq))
+        if candidate:
+            return candidate, True
+        
+        candidate = self._record_at(self.paused.first(after=seq)) or self._record_at(self.paused.first())
+        if candidate:
+            return candidate, False
+        
+        candidate = self._record_at(self.waiting.first())
+        if candidate:
+            return candidate, not candidate.is_opened
+        return None, False
+    
+    def visible(self):
+        # (record, position) pairs for files still on the list; positions count completed ones too
+        return [(file_data, position) for position, file_data in enumerate(self.records.values())
+                if not file_data.completed]
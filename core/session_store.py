@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import time
+
+from core.file_record import FileRecord
+
+class SessionStore:
+    # Local checkpoint of the work list, so a crash or reboot does not lose timers.
+    # Rows are upserted on every state change; WAL keeps each write to a short append.
+    COLUMNS = ('username', 'id', 'seq', 'path', 'client', 'is_active', 'is_paused', 'is_opened',
+               'elapsed_time', 'pause_count', 'save_count', 'idle_time', 'updated_at')
+    
+    def __init__(self, username, db_file="data/session.db"):
+        self.username = username
+        self.db_file = db_file
+        
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.conn = sqlite3.connect(db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS session_files (
+                username TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                client TEXT NOT NULL,
+                is_active INTEGER NOT NULL,
+                is_paused INTEGER NOT NULL,
+                is_opened INTEGER NOT NULL,
+                elapsed_time REAL NOT NULL,
+                pause_count INTEGER NOT NULL,
+                save_count INTEGER NOT NULL,
+                idle_time INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (username, id)
+            )
+        """)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(session_files)")]
+        if 'idle_time' not in columns:
+            self.conn.execute("ALTER TABLE session_files ADD COLUMN idle_time INTEGER NOT NULL DEFAULT 0")
+        # The current file, which may be paused, so it cannot be told from the rows alone
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS session_state (
+                username TEXT PRIMARY KEY,
+                active_id INTEGER
+            )
+        """)
+        self.conn.commit()
+        
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        self.upsert_sql = f"INSERT OR REPLACE INTO session_files ({', '.join(self.COLUMNS)}) VALUES ({placeholders})"
+    
+    def save(self, rows):
+        # rows: iterable of (record, seq, elapsed); one transaction for the whole batch
+        now = time.time()
+        params = [(self.username, record.id, seq, record.path, record.client,
+                   int(record.is_active), int(record.is_paused), int(record.is_opened),
+                   elapsed, record.pause_count, record.save_count, record.idle_time, now)
+                  for record, seq, elapsed in rows]
+        if not params:
+            return
+        
+        try:
+            with self.conn:
+                self.conn.executemany(self.upsert_sql, params)
+        except sqlite3.Error as e:
+            print(f"Error saving session: {e}")
+    
+    def delete(self, file_ids):
+        params = [(self.username, file_id) for file_id in file_ids]
+        try:
+            with self.conn:
+                self.conn.executemany("DELETE FROM session_files WHERE username = ? AND id = ?", params)
+        except sqlite3.Error as e:
+            print(f"Error saving session: {e}")
+    
+    def save_active(self, file_id):
+        try:
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO session_state (username, active_id) VALUES (?, ?)",
+                                  (self.username, file_id))
+        except sqlite3.Error as e:
+            print(f"Error saving session: {e}")
+    
+    def load_active(self):
+        try:
+            row = self.conn.execute("SELECT active_id FROM session_state WHERE username = ?",
+                                    (self.username,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error loading session: {e}")
+            return None
+        return row[0] if row else None
+    
+    def clear(self):
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM session_files WHERE username = ?", (self.username,))
+                self.conn.execute("DELETE FROM session_state WHERE username = ?", (self.username,))
+        except sqlite3.Error as e:
+            print(f"Error clearing session: {e}")
+    
+    def load(self):
+        # Returns [(record, seq, was_running)] in list order. Timers come back stopped:
+        # a file that was running when the app went down is restored as paused.
+        try:
+            rows = self.conn.execute(
+                "SELECT id, seq, path, client, is_active, is_paused, is_opened, elapsed_time, pause_count, save_count, idle_time "
+                "FROM session_files WHERE username = ? ORDER BY seq",
+                (self.username,)
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error loading session: {e}")
+            return []
+        
+        restored = []
+        for file_id, seq, path, client, is_active, is_paused, is_opened, elapsed, pause_count, save_count, idle_time in rows:
+            record = FileRecord(file_id, path, client)
+            record.is_active = bool(is_active)
+            record.is_paused = bool(is_active)
+            record.is_opened = bool(is_opened)
+            record.elapsed_time = elapsed
+            record.pause_count = pause_count
+            record.save_count = save_count
+            record.idle_time = int(idle_time)
+            restored.append((record, seq, bool(is_active) and not is_paused))
+        return restored
+    
+    def close(self):
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,137 @@
+import queue
+import threading
+import time
+
+class SyncWorker:
+    def __init__(self, send_func, on_overflow=None, max_queue_size=500):
+        self.send_func = send_func
+        self.on_overflow = on_overflow
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.dispatcher = None
+        self.running = False
+        self.thread = None
+        self.in_flight = 0
+        self.last_error = None
+        self.last_error_at = None
+        self.last_success_at = None
+        self._lock = threading.Lock()
+    
+    def set_dispatcher(self, dispatcher):
+        # dispatcher is usually a Tk widget's `after`, so callbacks run on the UI thread
+        self.dispatcher = dispatcher
+    
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def submit(self, data, callback=None):
+        try:
+            self.queue.put_nowait((data, callback))
+            return True
+        except queue.Full:
+            if self.on_overflow:
+                self.on_overflow(data)
+            self._dispatch(callback, False)
+            return False
+    
+    def _run(self):
+        # Runs until the stop sentinel, so an item already taken when stop() is called
+        # still finishes and the sentinel is always marked done
+        while True:
+            try:
+                item = self.queue.get(timeout=1)
+            except queue.Empty:
+                if not self.running:
+                    break
+                continue
+            
+            if item is None:
+                self.queue.task_done()
+                break
+            
+            data, callback = item
+            with self._lock:
+                self.in_flight += 1
+            
+            success = False
+            try:
+                success = self.send_func(data)
+                if success:
+                    with self._lock:
+                        self.last_success_at = time.time()
+                else:
+                    self._record_error("Insert failed, entry moved to offline queue")
+            except Exception as e:
+                self._record_error(str(e))
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                self.queue.task_done()
+            
+            self._dispatch(callback, success)
+    
+    def _record_error(self, message):
+        with self._lock:
+            self.last_error = message
+            self.last_error_at = time.time()
+    
+    def _dispatch(self, callback, success):
+        if not callback:
+            return
+        try:
+            if self.dispatcher:
+                self.dispatcher(0, lambda: callback(success))
+            else:
+                callback(success)
+        except Exception as e:
+            print(f"Sync callback error: {e}")
+    
+    def get_status(self):
+        with self._lock:
+            return {
+                'queue_depth': self.queue.qsize(),
+                'in_flight': self.in_flight,
+                'last_error': self.last_error,
+                'last_error_at': self.last_error_at,
+                'last_success_at': self.last_success_at
+            }
+    
+    def flush(self, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.05)
+        return False
+    
+    def stop(self, timeout=5):
+        if not self.running:
+            return
+        self.flush(timeout)
+        self.running = False
+        
+        # Whatever is still queued goes to the overflow handler; each item is marked done
+        # so a later flush() does not wait out its timeout
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.queue.task_done()
+            if item is None:
+                continue
+            data, callback = item
+            if self.on_overflow:
+                self.on_overflow(data)
+        
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+    
+    def join(self, timeout=5):
+        if self.thread:
+            self.thread.join(timeout)
@@ -0,0 +1,191 @@
+import importlib.util
+import os
+import urllib.request
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Seconds allowed per kind of call; reads page through large tables, health checks must be quick
+DEFAULT_TIMEOUTS = {
+    'health': 5,
+    'read': 20,
+    'write': 10,
+    'auth': 10,
+}
+
+class TransportError(Exception):
+    def __init__(self, status_code, message, code=None):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+        # PostgREST / Postgres error code from the response body, e.g. PGRST204 or 23502
+        self.code = code
+
+class TransportResponse:
+    def __init__(self, data):
+        self.data = data
+
+class QueryBuilder:
+    # The subset of the PostgREST builder the app uses, with the same method names as
+    # supabase-py so call sites work against either backend
+    def __init__(self, transport, table, operation=None):
+        self.transport = transport
+        self.table = table
+        # A fixed timeout class (e.g. 'auth') wins over the read/write one picked per method
+        self.timeout_class = operation
+        self.method = 'GET'
+        self.params = []
+        self.orders = []
+        self.body = None
+        self.prefer = []
+        self.operation = 'read'
+    
+    def select(self, columns='*'):
+        self.method = 'GET'
+        self.params.append(('select', columns))
+        return self
+    
+    def insert(self, rows):
+        self.method = 'POST'
+        self.body = rows
+        self.prefer = ['return=representation']
+        self.operation = 'write'
+        return self
+    
+    def upsert(self, rows, on_conflict=None, ignore_duplicates=False):
+        self.method = 'POST'
+        self.body = rows
+        if on_conflict:
+            self.params.append(('on_conflict', on_conflict))
+        resolution = 'ignore-duplicates' if ignore_duplicates else 'merge-duplicates'
+        self.prefer = [f'resolution={resolution}', 'return=representation']
+        self.operation = 'write'
+        return self
+    
+    def update(self, values):
+        self.method = 'PATCH'
+        self.body = values
+        self.prefer = ['return=representation']
+        self.operation = 'write'
+        return self
+    
+    def _filter(self, column, operator, value):
+        self.params.append((column, f"{operator}.{value}"))
+        return self
+    
+    def eq(self, column, value):
+        return self._filter(column, 'eq', value)
+    
+    def gt(self, column, value):
+        return self._filter(column, 'gt', value)
+    
+    def gte(self, column, value):
+        return self._filter(column, 'gte', value)
+    
+    def lt(self, column, value):
+        return self._filter(column, 'lt', value)
+    
+    def or_(self, filters):
+        self.params.append(('or', f"({filters})"))
+        return self
+    
+    def order(self, column, desc=False):
+        self.orders.append(f"{column}.{'desc' if desc else 'asc'}")
+        return self
+    
+    def limit(self, count):
+        self.params.append(('limit', str(count)))
+        return self
+    
+    def execute(self):
+        params = list(self.params)
+        if self.orders:
+            params.append(('order', ",".join(self.orders)))
+        headers = {'Prefer': ",".join(self.prefer)} if self.prefer else {}
+        
+        data = self.transport.request(self.method, f"/rest/v1/{self.table}", params=params,
+                                      json=self.body, headers=headers,
+                                      operation=self.timeout_class or self.operation)
+        return TransportResponse(data)
+
+class HttpTransport:
+    # One pooled httpx client for every REST call: connections (and TLS sessions) are kept
+    # alive between requests, HTTP/2 is used when the h2 package is installed, and proxy
+    # settings come from the environment as before.
+    def __init__(self, url, key, timeouts=None, max_connections=4, keepalive_expiry=120):
+        if httpx is None:
+            raise ImportError("HttpTransport requires httpx")
+        
+        self.url = url.rstrip('/')
+        self.key = key
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.session = httpx.Client(
+            base_url=self.url,
+            headers={'apikey': key, 'Authorization': f"Bearer {key}"},
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections,
+                                keepalive_expiry=keepalive_expiry),
+            timeout=self.timeouts['read'],
+            http2=importlib.util.find_spec('h2') is not None,
+        )
+    
+    def table(self, name, operation=None):
+        return QueryBuilder(self, name, operation)
+    
+    def request(self, method, path, params=None, json=None, headers=None, operation='read'):
+        response = self.session.request(method, path, params=params, json=json, headers=headers,
+                                        timeout=self.timeouts.get(operation, self.timeouts['read']))
+        if response.status_code >= 400:
+            raise TransportError(response.status_code, response.text[:200], code=self._error_code(response))
+        if not response.content:
+            return []
+        return response.json()
+    
+    def _error_code(self, response):
+        try:
+            body = response.json()
+        except ValueError:
+            return None
+        return body.get('code') if isinstance(body, dict) else None
+    
+    def health(self, timeout=None):
+        response = self.session.get("/auth/v1/health", timeout=timeout or self.timeouts['health'])
+        return response.status_code == 200
+    
+    def close(self):
+        self.session.close()
+
+class SupabasePyTransport:
+    # The supabase-py client as a backend, for environments without httpx pooling control
+    def __init__(self, url, key, timeouts=None):
+        from supabase import create_client
+        
+        self.url = url.rstrip('/')
+        self.key = key
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.client = create_client(url, key)
+    
+    def table(self, name, operation=None):
+        # supabase-py applies its own client-wide timeouts
+        return self.client.table(name)
+    
+    def health(self, timeout=None):
+        request = urllib.request.Request(f"{self.url}/auth/v1/health", headers={'apikey': self.key})
+        with urllib.request.urlopen(request, timeout=timeout or self.timeouts['health']) as response:
+            return response.status == 200
+    
+    def close(self):
+        pass
+
+TRANSPORTS = {
+    'http': HttpTransport,
+    'supabase': SupabasePyTransport,
+}
+
+def create_transport(url, key, backend=None, timeouts=None):
+    # SCHL_TRANSPORT picks the backend ('http' or 'supabase'); http falls back to supabase-py
+    backend = backend or os.environ.get('SCHL_TRANSPORT', 'http')
+    if backend == 'http' and httpx is None:
+        backend = 'supabase'
+    return TRANSPORTS[backend](url, key, timeouts=timeouts)
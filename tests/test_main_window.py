@@ -0,0 +1,127 @@
+import unittest
+from types import SimpleNamespace
+
+from core.file_record import FileRecord
+from core.idle_detector import IdleDetector
+from core.session import WorkSession
+from ui.main_window import MainWindow
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+    
+    def __call__(self):
+        return self.now
+
+class FakeRow:
+    def __init__(self):
+        self.timer_text = None
+    
+    def update_timer_text(self, text):
+        self.timer_text = text
+
+class WindowStub(SimpleNamespace):
+    # The parts of MainWindow its session glue touches, without Tk; MainWindow's own
+    # methods are called on it unbound
+    def __getattr__(self, name):
+        method = getattr(MainWindow, name)
+        return method.__get__(self)
+
+def make_window(count=2):
+    clock = FakeClock()
+    session = WorkSession(clock=clock)
+    rows = {}
+    for _ in range(count):
+        file_id = session.new_id()
+        session.add(FileRecord(file_id, f"C:\\Work\\0034_JH\\img_{file_id}.psd", "0034_JH"))
+        rows[file_id] = FakeRow()
+    
+    files_container = SimpleNamespace(row_for=lambda file_data: rows.get(file_data.id))
+    window = WindowStub(session=session, files_container=files_container, is_minimized=False,
+                        tray_icon=None, idle_detector=None)
+    return window, clock, rows
+
+class TickTest(unittest.TestCase):
+    def test_resumed_row_keeps_ticking_while_current_is_paused(self):
+        window, clock, rows = make_window()
+        first, second = window.session.get(1), window.session.get(2)
+        
+        window.session.start(first)
+        clock.now = 10
+        window.session.start(second)
+        clock.now = 20
+        window.session.toggle_pause(second)
+        # RESUME on the first row leaves the second one current but paused
+        window.session.toggle_pause(first)
+        self.assertEqual(window.session.active_id, 2)
+        self.assertEqual(window.session.running, {1})
+        
+        clock.now = 75.5
+        elapsed = window.on_tick(75.5)
+        self.assertEqual(elapsed, 65.5)
+        self.assertEqual(rows[1].timer_text, "01:05")
+        self.assertIsNone(rows[2].timer_text)
+    
+    def test_stops_when_nothing_runs(self):
+        window, clock, rows = make_window()
+        first = window.session.get(1)
+        window.session.start(first)
+        window.session.toggle_pause(first)
+        
+        self.assertIsNone(window.on_tick(30))
+        self.assertIsNone(rows[1].timer_text)
+    
+    def test_delay_follows_the_current_file_when_it_runs(self):
+        window, clock, rows = make_window()
+        first, second = window.session.get(1), window.session.get(2)
+        
+        window.session.start(first)
+        clock.now = 0.25
+        window.session.start(second)
+        window.session.toggle_pause(first)
+        clock.now = 10
+        
+        self.assertEqual(window.session.running, {1, 2})
+        self.assertEqual(window.on_tick(10), 9.75)
+        self.assertEqual(rows[1].timer_text, "00:10")
+        self.assertEqual(rows[2].timer_text, "00:09")
+
+class CompleteTest(unittest.TestCase):
+    def make_window(self):
+        window, clock, rows = make_window()
+        window.idle_detector = IdleDetector()
+        window.file_watcher = SimpleNamespace(get_save_count=lambda path: 0, unwatch=lambda path: None)
+        window.file_paths = set()
+        window.saved = []
+        window.save_to_supabase = lambda file_data, total_time: window.saved.append(file_data.id)
+        window.update_display = lambda: None
+        return window
+    
+    def test_done_on_another_row_keeps_the_current_file_ledger(self):
+        window = self.make_window()
+        first, second = window.session.get(1), window.session.get(2)
+        window.session.start(first)
+        window.session.start(second)
+        window.idle_detector.set_active_file(second.id)
+        
+        window.finish_complete_file(first, True)
+        
+        self.assertEqual(window.saved, [1])
+        self.assertEqual(window.session.active_id, 2)
+        self.assertEqual(window.session.running, {2})
+        self.assertEqual(window.idle_detector.ledger.active_file, 2)
+    
+    def test_done_on_the_current_file_clears_the_ledger(self):
+        window = self.make_window()
+        first = window.session.get(1)
+        window.session.start(first)
+        window.idle_detector.set_active_file(first.id)
+        window.session.remove(window.session.get(2))
+        
+        window.finish_complete_file(first, True)
+        
+        self.assertEqual(window.saved, [1])
+        self.assertIsNone(window.idle_detector.ledger.active_file)
+
+if __name__ == "__main__":
+    unittest.main()
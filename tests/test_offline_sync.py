@@ -0,0 +1,157 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from core.connection_monitor import ConnectionMonitor
+from core.offline_journal import OfflineJournal
+from core.supabase_client import SupabaseClient
+from core.transport import QueryBuilder
+
+class FakeTransport:
+    # Stands in for PostgREST: time_entries rows are unique on entry_id, like the real table,
+    # and an upsert with ignore-duplicates skips rows already there
+    def __init__(self):
+        self.rows = []
+        self.entry_ids = set()
+        self.upserts = 0
+        self.fail_after_write = set()
+        self._lock = threading.Lock()
+    
+    def table(self, name):
+        return QueryBuilder(self, name)
+    
+    def request(self, method, path, params=None, json=None, headers=None, operation='read'):
+        if method != 'POST' or path != "/rest/v1/time_entries":
+            raise AssertionError(f"Unexpected request: {method} {path}")
+        
+        with self._lock:
+            self.upserts += 1
+            inserted = []
+            for row in json:
+                if row['entry_id'] in self.entry_ids:
+                    continue
+                self.entry_ids.add(row['entry_id'])
+                self.rows.append(dict(row))
+                inserted.append(row)
+            
+            # The write landed but the answer never made it back
+            if self.upserts in self.fail_after_write:
+                raise TimeoutError("The write operation timed out")
+        return inserted
+    
+    def health(self, timeout=None):
+        return True
+    
+    def close(self):
+        pass
+
+class AckCrash(Exception):
+    pass
+
+class OfflineSyncTest(unittest.TestCase):
+    def setUp(self):
+        # SupabaseClient keeps its journal and credential cache under a relative data/
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp.name)
+        self.server = FakeTransport()
+    
+    def new_client(self):
+        # No background probes, so every sync in a test is one the test started
+        with mock.patch.object(ConnectionMonitor, 'start'):
+            client = SupabaseClient(transport=self.server)
+        self.addCleanup(client.shutdown)
+        return client
+    
+    def queue_entries(self, client, count):
+        entries = [{'employee_name': 'alice', 'filename': f"img_{i}.psd", 'time_spent_seconds': i}
+                   for i in range(count)]
+        for entry in entries:
+            client.save_to_offline_queue(entry)
+        return client.offline_journal.count()
+    
+    def assert_delivered_once(self, count):
+        self.assertEqual(len(self.server.rows), count)
+        self.assertEqual(len({row['entry_id'] for row in self.server.rows}), count)
+    
+    def test_crash_in_ack_then_resync(self):
+        client = self.new_client()
+        self.assertEqual(self.queue_entries(client, 120), 120)
+        
+        # The process dies after the second batch reached the server but before its ack
+        real_ack = client.offline_journal.ack
+        calls = []
+        def crashing_ack(entry_ids):
+            calls.append(entry_ids)
+            if len(calls) == 2:
+                raise AckCrash()
+            real_ack(entry_ids)
+        client.offline_journal.ack = crashing_ack
+        
+        with self.assertRaises(AckCrash):
+            client.sync_offline_queue(batch_size=50)
+        self.assertEqual(len(self.server.rows), 100)
+        
+        restarted = self.new_client()
+        self.assertEqual(restarted.offline_journal.count(), 70)
+        self.assertEqual(restarted.sync_offline_queue(batch_size=50), 70)
+        self.assertEqual(restarted.offline_journal.count(), 0)
+        self.assert_delivered_once(120)
+        
+        # Nothing is left to send after another restart either
+        self.assertEqual(OfflineJournal().count(), 0)
+        self.assertEqual(self.new_client().sync_offline_queue(), 0)
+        self.assert_delivered_once(120)
+    
+    def test_torn_ack_record_then_resync(self):
+        client = self.new_client()
+        self.queue_entries(client, 80)
+        
+        # Killed half way through writing the first ack record
+        def torn_ack(entry_ids):
+            with open(client.offline_journal.journal_file, 'a') as f:
+                f.write('{"op": "ack", "ids": ["')
+            raise AckCrash()
+        client.offline_journal.ack = torn_ack
+        
+        with self.assertRaises(AckCrash):
+            client.sync_offline_queue(batch_size=50)
+        
+        restarted = self.new_client()
+        self.assertEqual(restarted.offline_journal.count(), 80)
+        restarted.sync_offline_queue(batch_size=50)
+        self.assertEqual(restarted.offline_journal.count(), 0)
+        self.assert_delivered_once(80)
+    
+    def test_timed_out_send_that_landed(self):
+        client = self.new_client()
+        count = 30
+        # Every third direct send reaches the server and then times out
+        self.server.fail_after_write = set(range(1, count + 1, 3))
+        
+        results = []
+        for i in range(count):
+            client.insert_time_entry({'employee_name': 'alice', 'filename': f"img_{i}.psd",
+                                      'time_spent_seconds': i}, callback=results.append)
+        # Stopping and joining the worker lets the last callback run before we look
+        self.assertTrue(client.sync_worker.flush(timeout=10))
+        client.sync_worker.stop()
+        client.sync_worker.join()
+        
+        self.assertEqual(results.count(False), 10)
+        self.assertEqual(len(self.server.rows), count)
+        self.assertEqual(client.get_offline_queue_count(), 10)
+        
+        self.assertEqual(client.sync_offline_queue(), 10)
+        self.assertEqual(client.get_offline_queue_count(), 0)
+        self.assert_delivered_once(count)
+        
+        # A restart replays nothing
+        self.assertEqual(OfflineJournal().count(), 0)
+        self.assert_delivered_once(count)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import random
+import re
+import unittest
+
+from utils.client_rules import ClientRuleEngine
+from utils.path_parser import PathParser
+
+class LegacyPathParser:
+    # PathParser before the per-folder cache and single-pass rewrite, kept as the reference
+    def __init__(self):
+        self.patterns = [
+            r'\\\d{4}_[A-Z]+_[A-Za-z0-9]+\\',  # \0034_TOG_Enhance\
+            r'\\\d{4}_[A-Z]+\\',              # \0034_JH\
+            r'/\d{4}_[A-Z]+_[A-Za-z0-9]+/',   # /0034_TOG_Enhance/
+            r'/\d{4}_[A-Z]+/',                # /0034_JH/
+        ]
+    
+    def extract_client_from_path(self, file_path):
+        normalized_path = file_path.replace('/', '\\')
+        
+        for pattern in self.patterns:
+            matches = re.findall(pattern, normalized_path)
+            if matches:
+                client_match = re.search(r'\d{4}_[A-Z]+(?:_[A-Za-z0-9]+)?', matches[0])
+                if client_match:
+                    return client_match.group()
+        
+        path_parts = normalized_path.split('\\')
+        for part in path_parts:
+            if re.match(r'\d{4}_[A-Z]+', part):
+                return part
+            if re.match(r'\d{4}_[A-Z]+_[A-Za-z0-9]+', part):
+                return part
+        
+        for part in path_parts:
+            if any(c.isdigit() for c in part) and any(c.isalpha() for c in part):
+                return part
+        
+        return "Unknown_Client"
+
+def make_corpus(count, seed=1234, files_per_folder=1):
+    # Synthetic import paths: mixed separators, drive/UNC roots, real client folders and
+    # near misses (lower case, 3 digits, extra suffixes), clients only in the file name,
+    # and folders that only the loose alphanumeric fallback picks up
+    rng = random.Random(seed)
+    codes = ['JH', 'TOG', 'AB', 'XYZ', 'Q']
+    suffixes = ['Enhance', 'Retouch2', 'v3', 'CUT']
+    
+    def digits(n=4):
+        return f"{rng.randrange(10 ** n):0{n}d}"
+    
+    def folder():
+        kind = rng.random()
+        if kind < 0.15:
+            return f"{digits()}_{rng.choice(codes)}"
+        if kind < 0.25:
+            return f"{digits()}_{rng.choice(codes)}_{rng.choice(suffixes)}"
+        if kind < 0.35:
+            return rng.choice([f"{digits()}_{rng.choice(codes).lower()}",
+                               f"{digits(3)}_{rng.choice(codes)}",
+                               f"{digits()}_{rng.choice(codes)}_{rng.choice(suffixes)}_x",
+                               f"{digits()}_{rng.choice(codes)}-old",
+                               f"{digits()}{rng.choice(codes)}",
+                               f"x{digits()}_{rng.choice(codes)}",
+                               f"{digits()}_{rng.choice(codes)} copy"])
+        if kind < 0.45:
+            return rng.choice(['job42', 'batch 7', 'v2', '2024', 'Shoot01'])
+        return rng.choice(['Users', 'Work', 'Photos', 'Desktop', 'final', 'RAW', 'Edits', ''])
+    
+    def filename():
+        stem = rng.choice(['IMG_1234', 'photo', 'final', f"{digits()}_{rng.choice(codes)}",
+                           f"{digits()}_{rng.choice(codes)}_{rng.choice(suffixes)}", 'a1', 'scan'])
+        return stem + rng.choice(['.psd', '.jpg', '.tif', '.PSD', ''])
+    
+    roots = ['C:', 'D:', '', '\\\\server\\share', '/mnt/nas', 'Z:\\Jobs']
+    paths = []
+    while len(paths) < count:
+        directory = rng.choice(roots)
+        for _ in range(rng.randint(0, 6)):
+            directory += rng.choice('\\\\/') + folder()
+        for _ in range(min(files_per_folder, count - len(paths))):
+            path = directory + rng.choice('\\\\/') + filename()
+            if rng.random() < 0.02:
+                path += rng.choice('\\/')
+            paths.append(path)
+    return paths
+
+class PathParserEquivalenceTest(unittest.TestCase):
+    # With no rules configured the cached parser must answer exactly like the old one
+    def setUp(self):
+        self.parser = PathParser(rules=ClientRuleEngine(config_file=None))
+        self.legacy = LegacyPathParser()
+    
+    def assert_matches_legacy(self, paths):
+        for path in paths:
+            self.assertEqual(self.parser.extract_client_from_path(path),
+                             self.legacy.extract_client_from_path(path), path)
+    
+    def test_matches_legacy_parser_on_corpus(self):
+        self.assert_matches_legacy(make_corpus(200000, files_per_folder=4))
+    
+    def test_matches_legacy_parser_on_edge_cases(self):
+        self.assert_matches_legacy([
+            "",
+            "0034_JH.psd",
+            "C:\\0034_JH\\0035_TOG_Enhance\\a.psd",
+            "C:\\0035_TOG_Enhance\\0034_JH\\a.psd",
+            "C:/Work/0034_JH/a.psd",
+            "0034_JH\\a.psd",
+            "C:\\Work\\0034_JH_Enhance_v2\\a.psd",
+            "C:\\Work\\0034_jh\\job42\\a.psd",
+            "C:\\Work\\final\\0034_JH_Enhance.psd",
+            "\\\\server\\share\\0034_JH\\",
+            "C:\\Work\\Photos\\image.psd",
+        ])
+    
+    def test_batch_matches_single_lookups(self):
+        paths = make_corpus(5000, seed=7)
+        expected = [self.legacy.extract_client_from_path(path) for path in paths]
+        self.assertEqual(self.parser.extract_clients(paths), expected)
+    
+    def test_cache_is_per_folder(self):
+        self.parser.extract_clients([f"C:\\Work\\0034_JH\\img_{i}.psd" for i in range(100)])
+        self.assertEqual(self.parser._resolve_directory.cache_info().currsize, 1)
+
+if __name__ == "__main__":
+    unittest.main()
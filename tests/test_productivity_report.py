@@ -0,0 +1,193 @@
+import math
+import random
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from utils.productivity_report import (EntryColumns, group_stats, parse_hours, pause_distribution,
+                                       shift_breakdown)
+from utils.shift_detector import ShiftDetector
+
+HOUR_SHIFTS = ShiftDetector().get_hour_table()
+
+def reference_hour(value):
+    # The documented rule: the first 19 characters ("YYYY-MM-DDTHH:MM:SS") with at least
+    # the hour present; fractions and offsets are ignored
+    text = (value or '')[:19]
+    if len(text) < 13:
+        return -1
+    try:
+        return datetime.fromisoformat(text).hour
+    except ValueError:
+        return -1
+
+def reference_number(value):
+    return int(float(value)) if value not in (None, '') else 0
+
+def reference_label(row, column):
+    if column == 'completed_shift':
+        hour = reference_hour(row.get('completed_at'))
+        return HOUR_SHIFTS[hour] if hour >= 0 else None
+    return row.get(column) or ''
+
+def reference_percentile(values, q):
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100.0
+    lower, upper = math.floor(position), math.ceil(position)
+    fraction = position - lower
+    return values[lower] * (1 - fraction) + values[upper] * fraction
+
+def reference_groups(rows, by):
+    groups = {}
+    for row in rows:
+        labels = tuple(reference_label(row, column) for column in by)
+        groups.setdefault(labels, []).append(row)
+    return groups
+
+def reference_stats(rows, by, percentiles=(50, 90)):
+    result = []
+    for labels, members in reference_groups(rows, by).items():
+        times = [reference_number(row.get('time_spent_seconds')) for row in members]
+        idles = [reference_number(row.get('total_idle_seconds')) for row in members]
+        pauses = [reference_number(row.get('pause_count')) for row in members]
+        
+        stats = dict(zip(by, labels))
+        stats['entries'] = len(members)
+        stats['total_seconds'] = float(sum(times))
+        stats['mean_seconds'] = sum(times) / len(members)
+        stats['idle_seconds'] = float(sum(idles))
+        stats['idle_ratio'] = sum(idles) / sum(times) if sum(times) > 0 else 0.0
+        stats['mean_pauses'] = sum(pauses) / len(members)
+        for q in percentiles:
+            stats[f'time_p{q}'] = reference_percentile(times, q)
+            stats[f'pauses_p{q}'] = reference_percentile(pauses, q)
+        result.append(stats)
+    
+    result.sort(key=lambda stats: tuple('' if stats[column] is None else stats[column] for column in by))
+    return result
+
+def reference_pauses(rows, by, max_pauses=10):
+    distribution = {}
+    for labels, members in reference_groups(rows, by).items():
+        counts = [0] * (max_pauses + 1)
+        for row in members:
+            counts[min(reference_number(row.get('pause_count')), max_pauses)] += 1
+        distribution[labels] = counts
+    return distribution
+
+TIMESTAMPS = [
+    "2026-10-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}",
+    "2026-10-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}.123456+00:00",
+    "2026-10-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}+05:30",
+    "2026-10-{day:02d} {hour:02d}:{minute:02d}:{second:02d}",
+    "2026-10-{day:02d}T{hour:02d}",
+]
+UNKNOWN_TIMESTAMPS = ['', None, "2026-10-10", "2026-10-10T1", "not a timestamp at all", "2026-02-30T10:00:00"]
+
+def make_rows(count, seed=7, employees=5, clients=8, time_scale=3600):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        if rng.random() < 0.08:
+            completed_at = rng.choice(UNKNOWN_TIMESTAMPS)
+        else:
+            completed_at = rng.choice(TIMESTAMPS).format(day=rng.randint(1, 28), hour=rng.randrange(24),
+                                                         minute=rng.randrange(60), second=rng.randrange(60))
+        rows.append({
+            'employee_name': f"user{rng.randrange(employees)}",
+            'client_name': rng.choice([f"{rng.randrange(clients):04d}_JH", '', None]),
+            'work_type': rng.choice(['Retouch', 'Clipping', 'Masking']),
+            'shift': rng.choice(['Morning', 'Evening', 'Night']),
+            'time_spent_seconds': rng.choice([rng.randrange(time_scale), str(rng.randrange(time_scale)), None]),
+            'total_idle_seconds': rng.choice([rng.randrange(300), '', f"{rng.randrange(300)}.0"]),
+            'pause_count': rng.choice([rng.randrange(4), rng.randrange(30), None]),
+            'completed_at': completed_at,
+        })
+    return rows
+
+class ProductivityReportTest(unittest.TestCase):
+    def assert_stats_equal(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            self.assertEqual(got.keys(), want.keys())
+            for key, value in want.items():
+                if isinstance(value, float):
+                    self.assertTrue(math.isclose(got[key], value, rel_tol=1e-9, abs_tol=1e-9),
+                                    f"{key}: {got[key]} != {value} in {want}")
+                else:
+                    self.assertEqual(got[key], value, f"{key} in {want}")
+    
+    def test_parse_hours(self):
+        values = ["2026-10-10T10", "2026-10-10 07:15:00", "2026-10-10T23:59:59.999+05:00",
+                  "2026-10-10T00:00:00Z"] + [value or '' for value in UNKNOWN_TIMESTAMPS]
+        self.assertEqual(parse_hours(np.array(values, dtype=str)).tolist(),
+                         [reference_hour(value) for value in values])
+        
+        moments = np.array(['2026-10-10T05:59:59', 'NaT', '2026-10-11T00:00:00'], dtype='datetime64[s]')
+        self.assertEqual(parse_hours(moments).tolist(), [5, -1, 0])
+    
+    def test_empty(self):
+        entries = EntryColumns.from_rows([])
+        self.assertEqual(len(entries), 0)
+        self.assertEqual(group_stats(entries), [])
+        self.assertEqual(shift_breakdown(entries), [])
+        self.assertEqual(pause_distribution(entries), {})
+    
+    def test_matches_reference(self):
+        # Large enough that the few-label groupings count keys and the wide ones sort them
+        rows = make_rows(3000, employees=200, clients=40)
+        entries = EntryColumns.from_rows(rows)
+        
+        for by in [('employee_name',), ('client_name', 'work_type'),
+                   ('employee_name', 'client_name', 'work_type', 'shift')]:
+            with self.subTest(by=by):
+                self.assert_stats_equal(group_stats(entries, by=by, percentiles=(0, 25, 50, 90, 100)),
+                                        reference_stats(rows, by, percentiles=(0, 25, 50, 90, 100)))
+                self.assert_stats_equal(shift_breakdown(entries, by=by),
+                                        reference_stats(rows, by + ('completed_shift',)))
+                self.assertEqual(pause_distribution(entries, by=by), reference_pauses(rows, by))
+                self.assertEqual(pause_distribution(entries, by=by + ('completed_shift',), max_pauses=3),
+                                 reference_pauses(rows, by + ('completed_shift',), max_pauses=3))
+    
+    def test_unknown_shift_has_its_own_group(self):
+        rows = [{'employee_name': 'alice', 'completed_at': '', 'time_spent_seconds': 10},
+                {'employee_name': 'alice', 'completed_at': '2026-10-10T10:00:00', 'time_spent_seconds': 20},
+                {'employee_name': 'alice', 'completed_at': 'garbage', 'time_spent_seconds': 30}]
+        stats = shift_breakdown(EntryColumns.from_rows(rows))
+        
+        unknown = [row for row in stats if row['completed_shift'] is None]
+        self.assertEqual(len(unknown), 1)
+        self.assertEqual(unknown[0]['entries'], 2)
+        self.assertEqual(unknown[0]['total_seconds'], 40.0)
+        self.assert_stats_equal(stats, reference_stats(rows, ('employee_name', 'completed_shift')))
+    
+    def test_single_row_groups(self):
+        rows = make_rows(40, seed=3, employees=40)
+        for row in rows:
+            row['employee_name'] = f"solo{id(row)}"
+        entries = EntryColumns.from_rows(rows)
+        
+        stats = group_stats(entries)
+        self.assertTrue(all(row['entries'] == 1 for row in stats))
+        self.assert_stats_equal(stats, reference_stats(rows, ('employee_name',)))
+        self.assertEqual(pause_distribution(entries), reference_pauses(rows, ('employee_name',)))
+    
+    def test_wide_values_use_the_lexsort_path(self):
+        # group_count * value span passes 2**62, so the packed sort cannot be used
+        rows = make_rows(500, seed=11, time_scale=2 ** 61)
+        entries = EntryColumns.from_rows(rows)
+        self.assert_stats_equal(group_stats(entries, by=('client_name',)),
+                                reference_stats(rows, ('client_name',)))
+    
+    def test_percentiles_match_numpy(self):
+        rows = make_rows(1000, seed=5)
+        entries = EntryColumns.from_rows(rows)
+        for stats in group_stats(entries, by=('client_name',), percentiles=(10, 50, 95)):
+            times = [reference_number(row.get('time_spent_seconds')) for row in rows
+                     if (row.get('client_name') or '') == stats['client_name']]
+            for q in (10, 50, 95):
+                self.assertAlmostEqual(stats[f'time_p{q}'], float(np.percentile(times, q)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,305 @@
+import random
+import unittest
+
+from core.file_record import FileRecord
+from core.session import WorkSession
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+    
+    def __call__(self):
+        return self.now
+
+class LegacyFiles:
+    # The list-scanning state handling MainWindow had before WorkSession, minus the
+    # widgets and timers, kept as the reference the session model must agree with
+    def __init__(self, clock):
+        self.clock = clock
+        self.files = []
+        self.active_file_index = None
+    
+    def add(self, file_id):
+        self.files.append({'id': file_id, 'is_active': False, 'is_paused': False, 'is_opened': False,
+                           'elapsed_time': 0, 'start_time': None, 'completed': False, 'pause_count': 0})
+    
+    def clear(self):
+        self.files = []
+        self.active_file_index = None
+    
+    def remove(self, file_data):
+        idx = self.files.index(file_data)
+        self.files.remove(file_data)
+        if self.active_file_index is not None:
+            if self.active_file_index == idx:
+                self.active_file_index = None
+            elif self.active_file_index > idx:
+                self.active_file_index -= 1
+    
+    def open_file(self, file_data):
+        file_data['is_opened'] = True
+    
+    def open_next_file(self):
+        for file_data in self.files:
+            if not file_data['completed'] and not file_data['is_opened']:
+                self.open_file(file_data)
+                return
+    
+    def start_next_available_file(self):
+        for file_data in self.files:
+            if not file_data['completed'] and file_data['is_opened'] and not file_data['is_active']:
+                self.start_file(file_data)
+                return
+        
+        for file_data in self.files:
+            if not file_data['completed'] and not file_data['is_opened']:
+                self.open_file(file_data)
+                self.start_file(file_data)
+                return
+    
+    def toggle_current_pause(self):
+        if self.active_file_index is not None:
+            active_file = self.files[self.active_file_index]
+            if active_file['is_active']:
+                self.pause_file(active_file)
+    
+    def start_file(self, file_data):
+        for other_file in self.files:
+            if other_file['is_active'] and other_file is not file_data:
+                if not other_file['is_paused'] and other_file['start_time'] is not None:
+                    other_file['elapsed_time'] += self.clock() - other_file['start_time']
+                other_file['is_paused'] = True
+                other_file['start_time'] = None
+        
+        file_data['is_active'] = True
+        file_data['is_paused'] = False
+        file_data['start_time'] = self.clock()
+        self.active_file_index = self.files.index(file_data)
+    
+    def pause_file(self, file_data):
+        if not file_data['is_active']:
+            return
+        if file_data['is_paused']:
+            file_data['is_paused'] = False
+            file_data['start_time'] = self.clock()
+        else:
+            if file_data['start_time'] is not None:
+                file_data['elapsed_time'] += self.clock() - file_data['start_time']
+            file_data['is_paused'] = True
+            file_data['start_time'] = None
+            file_data['pause_count'] += 1
+    
+    def complete_current_file(self):
+        if self.active_file_index is not None:
+            active_file = self.files[self.active_file_index]
+            if active_file['is_active']:
+                return self.complete_file(active_file)
+        return None
+    
+    def complete_file(self, file_data):
+        total_time = file_data['elapsed_time']
+        if file_data['is_active'] and not file_data['is_paused'] and file_data['start_time'] is not None:
+            total_time += self.clock() - file_data['start_time']
+        file_data['completed'] = True
+        file_data['is_active'] = False
+        self.auto_start_next_file(file_data)
+        return total_time
+    
+    def auto_start_next_file(self, completed_file):
+        current_index = self.files.index(completed_file)
+        
+        for i in range(current_index + 1, len(self.files)):
+            file_data = self.files[i]
+            if not file_data['completed'] and file_data['is_opened'] and not file_data['is_active']:
+                self.open_file(file_data)
+                self.start_file(file_data)
+                return
+        
+        for i in range(current_index + 1, len(self.files)):
+            file_data = self.files[i]
+            if not file_data['completed'] and file_data['is_active'] and file_data['is_paused']:
+                self.start_file(file_data)
+                return
+        
+        for i in range(0, len(self.files)):
+            file_data = self.files[i]
+            if not file_data['completed'] and file_data['is_active'] and file_data['is_paused']:
+                self.start_file(file_data)
+                return
+        
+        for i in range(0, len(self.files)):
+            file_data = self.files[i]
+            if not file_data['completed'] and not file_data['is_active']:
+                if not file_data['is_opened']:
+                    self.open_file(file_data)
+                self.start_file(file_data)
+                return
+    
+    def find(self, file_id):
+        for file_data in self.files:
+            if file_data['id'] == file_id:
+                return file_data
+        return None
+    
+    def snapshot(self):
+        rows = []
+        for f in self.files:
+            if f['completed']:
+                rows.append((f['id'], True))
+                continue
+            elapsed = f['elapsed_time']
+            if f['is_active'] and not f['is_paused'] and f['start_time'] is not None:
+                elapsed += self.clock() - f['start_time']
+            rows.append((f['id'], False, f['is_active'], f['is_paused'], f['is_opened'], elapsed, f['pause_count']))
+        active = self.files[self.active_file_index]['id'] if self.active_file_index is not None else None
+        return rows, active
+
+class SessionDriver:
+    # The same user actions routed through WorkSession the way MainWindow does it
+    def __init__(self, clock):
+        self.session = WorkSession(clock=clock)
+    
+    def add(self, file_id):
+        self.session.add(FileRecord(file_id, f"C:\\Work\\0034_JH\\img_{file_id}.psd", "0034_JH"))
+    
+    def clear(self):
+        self.session.clear()
+    
+    def remove(self, file_data):
+        self.session.remove(file_data)
+    
+    def open_next_file(self):
+        file_data = self.session.next_unopened()
+        if file_data:
+            self.session.mark_opened(file_data)
+    
+    def start_next_available_file(self):
+        file_data = self.session.next_to_start()
+        if file_data:
+            if not file_data.is_opened:
+                self.session.mark_opened(file_data)
+            self.session.start(file_data)
+    
+    def toggle_current_pause(self):
+        active_file = self.session.active()
+        if active_file and active_file.is_active:
+            self.session.toggle_pause(active_file)
+    
+    def start_file(self, file_data):
+        self.session.start(file_data)
+    
+    def pause_file(self, file_data):
+        self.session.toggle_pause(file_data)
+    
+    def complete_current_file(self):
+        active_file = self.session.active()
+        if active_file and active_file.is_active:
+            return self.complete_file(active_file)
+        return None
+    
+    def complete_file(self, file_data):
+        total_time = self.session.complete(file_data)
+        next_file, open_first = self.session.next_after(file_data)
+        if next_file:
+            if open_first:
+                self.session.mark_opened(next_file)
+            self.session.start(next_file)
+        return total_time
+    
+    def find(self, file_id):
+        return self.session.get(file_id)
+    
+    def snapshot(self):
+        rows = []
+        for f in self.session:
+            if f.completed:
+                rows.append((f.id, True))
+                continue
+            rows.append((f.id, False, f.is_active, f.is_paused, f.is_opened,
+                         self.session.elapsed(f), f.pause_count))
+        return rows, self.session.active_id
+
+class WorkSessionSimulationTest(unittest.TestCase):
+    # Random start/pause/complete/add/remove sequences, no Tk involved: after every step
+    # the indexed session must be in exactly the state the old list scans produced
+    OPERATIONS = (
+        ('add', 12), ('remove', 3), ('open_next', 6), ('start_next', 10), ('start_row', 12),
+        ('pause_row', 10), ('toggle_current', 10), ('complete_current', 14), ('complete_row', 6),
+        ('tick', 17), ('clear', 0.3),
+    )
+    
+    def run_simulation(self, seed, steps):
+        rng = random.Random(seed)
+        clock = FakeClock()
+        legacy = LegacyFiles(clock)
+        driver = SessionDriver(clock)
+        names = [name for name, _ in self.OPERATIONS]
+        weights = [weight for _, weight in self.OPERATIONS]
+        next_id = 1
+        
+        for step in range(steps):
+            operation = rng.choices(names, weights)[0]
+            visible = [f['id'] for f in legacy.files if not f['completed']]
+            
+            if operation == 'add' or (not visible and operation != 'tick'):
+                for _ in range(rng.randint(1, 5)):
+                    legacy.add(next_id)
+                    driver.add(next_id)
+                    next_id += 1
+            elif operation == 'tick':
+                clock.now += rng.randint(1, 120)
+            elif operation == 'clear':
+                legacy.clear()
+                driver.clear()
+            elif operation == 'remove':
+                file_id = rng.choice(visible)
+                legacy.remove(legacy.find(file_id))
+                driver.remove(driver.find(file_id))
+            elif operation in ('open_next', 'start_next', 'toggle_current'):
+                method = {'open_next': 'open_next_file', 'start_next': 'start_next_available_file',
+                          'toggle_current': 'toggle_current_pause'}[operation]
+                getattr(legacy, method)()
+                getattr(driver, method)()
+            elif operation == 'complete_current':
+                self.assertEqual(legacy.complete_current_file(), driver.complete_current_file())
+            else:
+                # Row buttons: START on opened idle rows, PAUSE/RESUME and DONE on active rows
+                if operation == 'start_row':
+                    candidates = [f['id'] for f in legacy.files
+                                  if not f['completed'] and f['is_opened'] and not f['is_active']]
+                else:
+                    candidates = [f['id'] for f in legacy.files if not f['completed'] and f['is_active']]
+                if candidates:
+                    file_id = rng.choice(candidates)
+                    if operation == 'start_row':
+                        legacy.start_file(legacy.find(file_id))
+                        driver.start_file(driver.find(file_id))
+                    elif operation == 'pause_row':
+                        legacy.pause_file(legacy.find(file_id))
+                        driver.pause_file(driver.find(file_id))
+                    else:
+                        self.assertEqual(legacy.complete_file(legacy.find(file_id)),
+                                         driver.complete_file(driver.find(file_id)))
+            
+            self.assertEqual(legacy.snapshot(), driver.snapshot(), f"seed {seed}, step {step}: {operation}")
+        return driver.session
+    
+    def test_matches_list_scans(self):
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.run_simulation(seed, steps=10000)
+    
+    def test_indices_track_record_state(self):
+        session = self.run_simulation(seed=42, steps=10000)
+        live = [f for f in session if not f.completed]
+        seqs = session.seq
+        
+        self.assertEqual(session.unopened.keys, sorted(seqs[f.id] for f in live if not f.is_opened))
+        self.assertEqual(session.waiting.keys, sorted(seqs[f.id] for f in live if not f.is_active))
+        self.assertEqual(session.opened_waiting.keys,
+                         sorted(seqs[f.id] for f in live if f.is_opened and not f.is_active))
+        self.assertEqual(session.paused.keys, sorted(seqs[f.id] for f in live if f.is_active and f.is_paused))
+        self.assertEqual(session.running, {f.id for f in live if f.is_active and not f.is_paused})
+
+if __name__ == "__main__":
+    unittest.main()
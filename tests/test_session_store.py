@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from core.file_record import FileRecord
+from core.session import WorkSession
+from core.session_store import SessionStore
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+    
+    def __call__(self):
+        return self.now
+
+class SessionRestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.tmp.name, "session.db")
+        self.clock = FakeClock()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def new_session(self, count=3):
+        session = WorkSession(clock=self.clock, store=SessionStore("alice", self.db_file))
+        with session.batch():
+            for _ in range(count):
+                file_id = session.new_id()
+                session.add(FileRecord(file_id, f"C:\\Work\\0034_JH\\img_{file_id}.psd", "0034_JH"))
+        return session
+    
+    def reopen(self, session):
+        # A closed app: the store is reopened from disk by a fresh session
+        session.store.close()
+        restored = WorkSession(clock=self.clock)
+        restored.restore(SessionStore("alice", self.db_file))
+        self.addCleanup(restored.store.close)
+        return restored
+    
+    def test_paused_current_file_is_restored_as_current(self):
+        session = self.new_session()
+        first = session.get(1)
+        session.start(first)
+        self.clock.now = 90
+        session.toggle_pause(first)
+        
+        restored = self.reopen(session)
+        current = restored.active()
+        self.assertIsNotNone(current)
+        self.assertEqual(current.id, 1)
+        self.assertTrue(current.is_active and current.is_paused)
+        self.assertEqual(current.elapsed_time, 90)
+        
+        # RESUME on the restored row must drive the timer again
+        restored.toggle_pause(current)
+        self.clock.now = 100
+        self.assertEqual(restored.elapsed(restored.active()), 100)
+    
+    def test_running_current_file_comes_back_paused(self):
+        session = self.new_session()
+        session.start(session.get(2))
+        self.clock.now = 30
+        session.checkpoint()
+        
+        current = self.reopen(session).active()
+        self.assertEqual(current.id, 2)
+        self.assertTrue(current.is_paused)
+        self.assertEqual(current.elapsed_time, 30)
+    
+    def test_current_follows_the_last_started_file(self):
+        session = self.new_session()
+        session.start(session.get(1))
+        session.start(session.get(3))
+        session.toggle_pause(session.get(3))
+        self.assertEqual(self.reopen(session).active_id, 3)
+    
+    def test_removed_current_file_is_not_restored(self):
+        session = self.new_session()
+        session.start(session.get(1))
+        session.remove(session.get(1))
+        self.assertIsNone(self.reopen(session).active_id)
+    
+    def test_completed_current_file_is_not_restored(self):
+        session = self.new_session()
+        session.start(session.get(1))
+        session.complete(session.get(1))
+        self.assertIsNone(self.reopen(session).active_id)
+    
+    def test_idle_time_survives_a_restart(self):
+        session = self.new_session()
+        session.get(2).idle_time = 45
+        session.save_all()
+        self.assertEqual(self.reopen(session).get(2).idle_time, 45)
+    
+    def test_checkpoint_from_before_the_current_id_falls_back_to_running_file(self):
+        conn = sqlite3.connect(self.db_file)
+        conn.execute("""
+            CREATE TABLE session_files (
+                username TEXT NOT NULL, id INTEGER NOT NULL, seq INTEGER NOT NULL, path TEXT NOT NULL,
+                client TEXT NOT NULL, is_active INTEGER NOT NULL, is_paused INTEGER NOT NULL,
+                is_opened INTEGER NOT NULL, elapsed_time REAL NOT NULL, pause_count INTEGER NOT NULL,
+                save_count INTEGER NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (username, id)
+            )
+        """)
+        conn.executemany("INSERT INTO session_files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            ("alice", 1, 1, "C:\\a.psd", "0034_JH", 1, 1, 1, 10.0, 1, 0, 0.0),
+            ("alice", 2, 2, "C:\\b.psd", "0034_JH", 1, 0, 1, 20.0, 0, 0, 0.0),
+        ])
+        conn.commit()
+        conn.close()
+        
+        restored = WorkSession(clock=self.clock)
+        restored.restore(SessionStore("alice", self.db_file))
+        self.addCleanup(restored.store.close)
+        self.assertEqual(restored.active_id, 2)
+        self.assertEqual(restored.get(1).idle_time, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import threading
+import time
+import unittest
+
+from core.sync_worker import SyncWorker
+
+class SyncWorkerStopTest(unittest.TestCase):
+    def test_stop_drains_to_overflow_and_settles(self):
+        release = threading.Event()
+        sent, overflow = [], []
+        def send(data):
+            release.wait(5)
+            sent.append(data)
+            return True
+        
+        worker = SyncWorker(send, on_overflow=overflow.append)
+        worker.start()
+        for i in range(5):
+            worker.submit(i)
+        
+        # The first item is in flight; the rest are still queued when stop gives up waiting
+        worker.stop(timeout=0.2)
+        release.set()
+        worker.join()
+        
+        self.assertEqual(sent, [0])
+        self.assertEqual(overflow, [1, 2, 3, 4])
+        self.assertFalse(worker.thread.is_alive())
+        self.assertEqual(worker.queue.unfinished_tasks, 0)
+        
+        started = time.monotonic()
+        self.assertTrue(worker.flush(timeout=5))
+        worker.stop()
+        self.assertLess(time.monotonic() - started, 1)
+    
+    def test_stop_twice(self):
+        worker = SyncWorker(lambda data: True)
+        worker.start()
+        worker.submit('a')
+        worker.stop()
+        worker.join()
+        worker.stop()
+        
+        self.assertFalse(worker.thread.is_alive())
+        self.assertEqual(worker.queue.unfinished_tasks, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.connection_monitor import ConnectionMonitor
+from core.supabase_client import SupabaseClient
+from core.transport import HttpTransport, httpx
+
+@unittest.skipIf(httpx is None, "needs httpx")
+class TimeoutClassTest(unittest.TestCase):
+    TIMEOUTS = {'health': 1, 'read': 2, 'write': 3, 'auth': 4}
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp.name)
+        
+        self.requests = []
+        transport = HttpTransport("http://localhost", "key", timeouts=self.TIMEOUTS)
+        transport.session = httpx.Client(base_url=transport.url, transport=httpx.MockTransport(self.answer))
+        self.transport = transport
+    
+    def answer(self, request):
+        self.requests.append((request.method, request.url.path, request.extensions['timeout']['read']))
+        if request.method == 'GET':
+            return httpx.Response(200, json=[])
+        return httpx.Response(201, json=[json.loads(request.content)])
+    
+    def test_app_user_calls_use_the_auth_timeout(self):
+        with mock.patch.object(ConnectionMonitor, 'start'):
+            client = SupabaseClient(transport=self.transport)
+        self.addCleanup(client.shutdown)
+        
+        ok, message = client.register_user("alice", "secret")
+        self.assertTrue(ok, message)
+        self.assertEqual(self.requests, [('GET', "/rest/v1/app_user", 4), ('POST', "/rest/v1/app_user", 4)])
+    
+    def test_other_tables_keep_read_and_write(self):
+        self.transport.table('time_entries').select('*').execute()
+        self.transport.table('time_entries').upsert([{'entry_id': 'a'}], on_conflict='entry_id').execute()
+        self.assertEqual([timeout for _, _, timeout in self.requests], [2, 3])
+
+if __name__ == "__main__":
+    unittest.main()
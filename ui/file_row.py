@@ -0,0 +1,101 @@
+import customtkinter as ctk
+
+class FileRow:
+    def __init__(self, main_window, parent, height=36):
+        self.main_window = main_window
+        self.file_data = None
+        self.mode = None
+        self.signature = None
+        self.timer_label = None
+        self.pause_btn = None
+        self.start_btn = None
+        self.status_label = None
+        
+        # The owning list positions the frame, so it keeps a fixed height
+        self.frame = ctk.CTkFrame(parent, height=height)
+        self.frame.pack_propagate(False)
+        
+        self.order_label = ctk.CTkLabel(self.frame, text="", width=30)
+        self.order_label.pack(side="left", padx=5)
+        
+        self.name_label = ctk.CTkLabel(self.frame, text="", anchor="w", width=250)
+        self.name_label.pack(side="left", padx=10, fill="x", expand=True)
+        
+        self.btn_frame = ctk.CTkFrame(self.frame)
+        self.btn_frame.pack(side="right", padx=5)
+    
+    def update(self, file_data, index):
+        client_color = self.main_window.get_client_color(file_data.client)
+        self.file_data = file_data
+        signature = (file_data.id, index, file_data.is_active, file_data.is_paused,
+                     file_data.is_opened, file_data.display_text, client_color)
+        if signature == self.signature:
+            return
+        self.signature = signature
+        
+        self.order_label.configure(text=f"{index+1}.")
+        
+        mode = 'active' if file_data.is_active else 'idle'
+        if mode != self.mode:
+            self.build_buttons(mode)
+        
+        if mode == 'active':
+            if file_data.is_paused:
+                self.name_label.configure(text=f"⏸ {file_data.display_text}", text_color="#FFA500")
+            else:
+                self.name_label.configure(text=f"● {file_data.display_text}", text_color="#2E8B57")
+            
+            elapsed = self.main_window.get_elapsed(file_data)
+            self.update_timer_text(self.main_window.format_elapsed(elapsed))
+            self.pause_btn.configure(text="RESUME" if file_data.is_paused else "PAUSE")
+        else:
+            self.name_label.configure(text=file_data.display_text, text_color=client_color)
+            
+            status_text = "✓ Opened" if file_data.is_opened else "Not opened"
+            status_color = "#4CAF50" if file_data.is_opened else "#888888"
+            self.status_label.configure(text=status_text, text_color=status_color)
+            self.start_btn.configure(state="normal" if file_data.is_opened else "disabled")
+    
+    def build_buttons(self, mode):
+        for widget in self.btn_frame.winfo_children():
+            widget.destroy()
+        self.timer_label = None
+        self.pause_btn = None
+        self.start_btn = None
+        self.status_label = None
+        self.mode = mode
+        
+        # Buttons act on whatever file the row currently shows
+        if mode == 'active':
+            self.timer_label = ctk.CTkLabel(self.btn_frame, text="00:00", width=60)
+            self.timer_label.pack(side="left", padx=2)
+            
+            self.pause_btn = ctk.CTkButton(self.btn_frame, text="PAUSE", width=70,
+                                           command=lambda: self.main_window.pause_file(self.file_data))
+            self.pause_btn.pack(side="left", padx=2)
+            
+            done_btn = ctk.CTkButton(self.btn_frame, text="DONE", width=70,
+                                     command=lambda: self.main_window.complete_file(self.file_data))
+            done_btn.pack(side="left", padx=2)
+        else:
+            self.status_label = ctk.CTkLabel(self.btn_frame, text="", width=70,
+                                             font=ctk.CTkFont(size=11))
+            self.status_label.pack(side="left", padx=2)
+            
+            self.start_btn = ctk.CTkButton(self.btn_frame, text="START", width=70,
+                                           command=lambda: self.main_window.start_file(self.file_data))
+            self.start_btn.pack(side="left", padx=2)
+        
+        remove_btn = ctk.CTkButton(self.btn_frame, text="✕", width=30,
+                                   command=lambda: self.main_window.remove_single_file(self.file_data),
+                                   fg_color="#DC143C",
+                                   hover_color="#B22222")
+        remove_btn.pack(side="left", padx=2)
+    
+    def update_timer_text(self, timer_text):
+        if self.timer_label and self.timer_label.cget("text") != timer_text:
+            self.timer_label.configure(text=timer_text)
+    
+    def unbind(self):
+        self.file_data = None
+        self.signature = None
@@ -1,4 +1,5 @@
 import customtkinter as ctk
+import threading
 from tkinter import messagebox
 
 class LoginWindow(ctk.CTkToplevel):
@@ -8,6 +9,7 @@ class LoginWindow(ctk.CTkToplevel):
         self.supabase = supabase_client
         self.on_login_success = on_login_success
         self.logged_in_user = None
+        self.busy = False
         
         self.title("SCHL TIME TRACKER - Login")
         self.geometry("400x450")
@@ -39,7 +41,14 @@ class LoginWindow(ctk.CTkToplevel):
         
         ctk.CTkLabel(main_frame, text="Password:", anchor="w").pack(fill="x", padx=30)
         self.password_entry = ctk.CTkEntry(main_frame, width=300, height=40, show="*")
-        self.password_entry.pack(padx=30, pady=(5, 20))
+        self.password_entry.pack(padx=30, pady=(5, 10))
+        
+        # Opt-in: a remembered login is answered locally and does not see a password
+        # changed on the server until the cached verifier expires
+        self.remember_var = ctk.BooleanVar(value=False)
+        self.remember_check = ctk.CTkCheckBox(main_frame, text="Remember me on this computer",
+                                              variable=self.remember_var)
+        self.remember_check.pack(fill="x", padx=30, pady=(0, 10))
         
         self.login_btn = ctk.CTkButton(main_frame, text="LOGIN", width=300, height=45,
                                       font=ctk.CTkFont(size=14, weight="bold"),
@@ -59,6 +68,9 @@ class LoginWindow(ctk.CTkToplevel):
         self.status_label = ctk.CTkLabel(main_frame, text="", font=ctk.CTkFont(size=12))
         self.status_label.pack(pady=10)
         
+        # Shown only while a login/registration is running on the worker thread
+        self.spinner = ctk.CTkProgressBar(main_frame, width=300, mode="indeterminate")
+        
         self.username_entry.bind('<Return>', lambda e: self.password_entry.focus())
         self.password_entry.bind('<Return>', lambda e: self.login())
     
@@ -70,13 +82,22 @@ class LoginWindow(ctk.CTkToplevel):
             self.status_label.configure(text="Please enter username and password", text_color="#FF6B6B")
             return
         
-        self.login_btn.configure(state="disabled", text="Logging in...")
-        self.update()
+        if self.busy:
+            return
         
-        success, user_data, message = self.supabase.login_user(username, password)
+        self.login_btn.configure(text="Logging in...")
+        remember = self.remember_var.get()
+        self.run_in_background(
+            lambda: self.supabase.login_user(username, password, allow_cached=remember, remember=remember),
+            self.on_login_result)
+    
+    def on_login_result(self, result):
+        self.set_busy(False)
+        success, user_data, message = result
         
         if success:
             self.status_label.configure(text="Login successful!", text_color="#4CAF50")
+            self.login_btn.configure(state="disabled")
             self.logged_in_user = user_data
             self.after(500, self.complete_login)
         else:
@@ -95,10 +116,16 @@ class LoginWindow(ctk.CTkToplevel):
             self.status_label.configure(text="Password must be at least 4 characters", text_color="#FF6B6B")
             return
         
-        self.register_btn.configure(state="disabled", text="Registering...")
-        self.update()
+        if self.busy:
+            return
         
-        success, message = self.supabase.register_user(username, password)
+        self.register_btn.configure(text="Registering...")
+        self.run_in_background(lambda: self.supabase.register_user(username, password),
+                               self.on_register_result)
+    
+    def on_register_result(self, result):
+        self.set_busy(False)
+        success, message = result
         
         if success:
             self.status_label.configure(text="Registration successful! You can now login.", text_color="#4CAF50")
@@ -107,6 +134,46 @@ class LoginWindow(ctk.CTkToplevel):
         
         self.register_btn.configure(state="normal", text="REGISTER NEW ACCOUNT")
     
+    def run_in_background(self, task, on_done):
+        # Password hashing and the database round-trip happen off the Tk thread
+        self.set_busy(True)
+        
+        def worker():
+            try:
+                result = task()
+            except Exception as e:
+                result = None
+                print(f"Login worker error: {e}")
+            try:
+                self.after(0, lambda: on_done(result) if result is not None else self.on_task_failed())
+            except Exception:
+                # Window closed while the task was running
+                pass
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def on_task_failed(self):
+        self.set_busy(False)
+        self.status_label.configure(text="Something went wrong, please try again", text_color="#FF6B6B")
+        self.login_btn.configure(text="LOGIN")
+        self.register_btn.configure(text="REGISTER NEW ACCOUNT")
+    
+    def set_busy(self, busy):
+        self.busy = busy
+        state = "disabled" if busy else "normal"
+        self.login_btn.configure(state=state)
+        self.register_btn.configure(state=state)
+        self.username_entry.configure(state=state)
+        self.password_entry.configure(state=state)
+        
+        if busy:
+            self.status_label.configure(text="")
+            self.spinner.pack(pady=(0, 10))
+            self.spinner.start()
+        else:
+            self.spinner.stop()
+            self.spinner.pack_forget()
+    
     def complete_login(self):
         self.grab_release()
         self.on_login_success(self.logged_in_user)
@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
 import subprocess
+import threading
 from datetime import datetime
 
 from core.supabase_client import SupabaseClient
@@ -10,6 +11,16 @@ from core.idle_detector import IdleDetector
 from utils.shift_detector import ShiftDetector
 from utils.path_parser import PathParser
 from ui.tray_icon import TrayIcon
+from ui.virtual_list import VirtualFileList
+from ui.ticker import Ticker
+from ui.report_window import ReportWindow
+from core.file_stat_cache import DirectoryStatCache
+from core.file_watcher import FileWatcher
+from core.session import WorkSession
+from core.session_store import SessionStore
+from core.entry_cache import EntryCache
+from core.file_record import FileRecord
+from utils.file_scanner import iter_files, iter_batches, normalize_path
 
 class MainWindow(ctk.CTk):
     def __init__(self):
@@ -20,20 +31,30 @@ class MainWindow(ctk.CTk):
         self.attributes('-topmost', True)
         
         self.supabase = SupabaseClient()
+        self.supabase.sync_worker.set_dispatcher(self.after)
+        self.supabase.add_connection_listener(
+            lambda online, synced: self.after(0, lambda: self.on_connection_change(online, synced)))
         self.shift_detector = ShiftDetector()
         self.path_parser = PathParser()
+        self.stat_cache = DirectoryStatCache()
+        self.file_watcher = FileWatcher()
+        self.file_watcher.start()
         self.idle_detector = None
         
-        self.files = []
-        self.active_file_index = None
+        self.session = WorkSession()
+        self.file_paths = set()
+        self.importing_folder = False
         self.is_minimized = False
         self.client_colors = {}
         self.color_palette = ["#FFFFFF", "#FFB6C1", "#87CEEB", "#98FB98", "#FFD700", "#DDA0DD", "#FFA07A", "#20B2AA"]
         self.color_index = 0
         self.completing_file = False
         self.logged_in_user = None
+        self.entry_cache = None
+        self.report_window = None
         self.current_file_pause_count = 0
         self.current_file_idle_time = 0
+        self.ticker = Ticker(self, self.on_tick, is_visible=self.is_timer_visible)
         
         self.withdraw()
         self.show_login()
@@ -44,24 +65,27 @@ class MainWindow(ctk.CTk):
     
     def on_login_success(self, user_data):
         self.logged_in_user = user_data
+        self.entry_cache = EntryCache(self.get_employee_name())
         self.deiconify()
         self.create_startup_screen()
         self.tray_icon = TrayIcon(self)
         
-        self.sync_offline_data()
+        self.supabase.connection_monitor.check_now()
         
         self.bind('<Alt-Shift-D>', self.complete_current_file)
         self.bind('<Alt-Shift-S>', self.start_next_available_file)
         self.bind('<Alt-Shift-P>', self.toggle_current_pause)
     
-    def sync_offline_data(self):
-        count = self.supabase.sync_offline_queue()
-        if count > 0:
-            messagebox.showinfo("Sync Complete", f"Synced {count} offline entries to database")
+    def on_connection_change(self, online, synced):
+        if synced > 0 and self.logged_in_user:
+            messagebox.showinfo("Sync Complete", f"Synced {synced} offline entries to database")
         
         pending = self.supabase.get_offline_queue_count()
         if pending > 0:
             print(f"{pending} entries still pending sync")
+        
+        if hasattr(self, 'connection_label'):
+            self.refresh_connection_labels()
     
     def create_startup_screen(self):
         self.main_frame = ctk.CTkFrame(self)
@@ -112,19 +136,40 @@ class MainWindow(ctk.CTk):
     def start_work(self):
         self.main_frame.destroy()
         self.create_work_interface()
+        self.restore_session()
         
         self.idle_detector = IdleDetector(idle_threshold=60, callback=self.on_idle_change)
         self.idle_detector.start()
+        # A restored current file keeps collecting idle time from here on
+        active_file = self.session.active()
+        if active_file and active_file.is_active:
+            self.idle_detector.set_active_file(active_file.id)
+    
+    def restore_session(self):
+        # Brings back the work list from the last run; files that were running come back paused
+        self.session.restore(SessionStore(self.get_employee_name()))
+        for file_data in self.session:
+            self.file_paths.add(normalize_path(file_data.path))
+            self.file_watcher.watch(file_data.path)
+        
+        if self.session:
+            self.open_next_btn.configure(state="normal")
+            self.update_display()
+        
+        self.after(30000, self.checkpoint_session)
+    
+    def checkpoint_session(self):
+        self.session.checkpoint()
+        self.after(30000, self.checkpoint_session)
     
     def on_idle_change(self, status):
         if status == 'idle_start':
-            if self.active_file_index is not None:
-                active_file = self.files[self.active_file_index]
-                if active_file['is_active'] and not active_file['is_paused']:
-                    self.after(0, lambda: self.auto_pause_for_idle(active_file))
+            active_file = self.session.active()
+            if active_file and active_file.is_active and not active_file.is_paused:
+                self.after(0, lambda: self.auto_pause_for_idle(active_file))
     
     def auto_pause_for_idle(self, file_data):
-        if file_data['is_active'] and not file_data['is_paused']:
+        if file_data.is_active and not file_data.is_paused:
             self.pause_file(file_data)
             print("Auto-paused due to idle")
     
@@ -162,6 +207,10 @@ class MainWindow(ctk.CTk):
                                                font=ctk.CTkFont(size=10))
         self.offline_count_label.pack(side="left", padx=5)
         
+        self.sync_status_label = ctk.CTkLabel(status_frame, text="", 
+                                             font=ctk.CTkFont(size=10))
+        self.sync_status_label.pack(side="left", padx=5)
+        
         control_frame = ctk.CTkFrame(header_frame)
         control_frame.pack(side="right", padx=10)
         
@@ -169,6 +218,14 @@ class MainWindow(ctk.CTk):
                                           command=self.add_files)
         self.add_files_btn.pack(side="left", padx=5)
         
+        self.add_folder_btn = ctk.CTkButton(control_frame, text="+ ADD FOLDER",
+                                           command=self.add_folder)
+        self.add_folder_btn.pack(side="left", padx=5)
+        
+        self.report_btn = ctk.CTkButton(control_frame, text="REPORT",
+                                        command=self.open_report)
+        self.report_btn.pack(side="left", padx=5)
+        
         self.clean_all_btn = ctk.CTkButton(control_frame, text="CLEAN ALL",
                                           command=self.clean_all_files,
                                           fg_color="#DC143C",
@@ -193,7 +250,9 @@ class MainWindow(ctk.CTk):
                                           state="disabled")
         self.open_next_btn.pack(side="right", padx=5)
         
-        self.files_container = ctk.CTkScrollableFrame(self.files_frame)
+        # Only the rows in view are materialized, so thousand-file batches stay light
+        self.files_container = VirtualFileList(self.files_frame, self,
+                                               empty_text="No files added yet. Click '+ ADD FILES' or '+ ADD FOLDER' to start tracking.")
         self.files_container.pack(fill="both", expand=True, padx=10, pady=10)
         
         self.show_no_files_message()
@@ -201,11 +260,16 @@ class MainWindow(ctk.CTk):
         self.update_connection_status()
     
     def update_connection_status(self):
-        if self.supabase.check_connection():
-            self.connection_label.configure(text="● Online", text_color="#4CAF50")
-            self.sync_offline_data()
-        else:
+        self.refresh_connection_labels()
+        self.after(30000, self.update_connection_status)
+    
+    def refresh_connection_labels(self):
+        if self.supabase.connection_monitor.is_online is False:
             self.connection_label.configure(text="● Offline", text_color="#FF6B6B")
+        else:
+            latency = self.supabase.connection_monitor.histogram.percentile(50)
+            online_text = f"● Online ({latency:.0f} ms)" if latency is not None else "● Online"
+            self.connection_label.configure(text=online_text, text_color="#4CAF50")
         
         pending = self.supabase.get_offline_queue_count()
         if pending > 0:
@@ -213,16 +277,45 @@ class MainWindow(ctk.CTk):
         else:
             self.offline_count_label.configure(text="")
         
-        self.after(30000, self.update_connection_status)
+        self.update_sync_status()
     
-    def show_no_files_message(self):
-        for widget in self.files_container.winfo_children():
-            widget.destroy()
+    def update_sync_status(self):
+        status = self.supabase.get_sync_status()
+        pending = status['queue_depth'] + status['in_flight']
         
-        message_label = ctk.CTkLabel(self.files_container, 
-                                   text="No files added yet. Click '+ ADD FILES' to start tracking.",
-                                   font=ctk.CTkFont(size=14))
-        message_label.pack(pady=50)
+        if pending > 0:
+            self.sync_status_label.configure(text=f"Syncing {pending}...", text_color="#FFA500")
+        elif status['last_error'] and (status['last_success_at'] or 0) < status['last_error_at']:
+            self.sync_status_label.configure(text="Last sync failed", text_color="#FF6B6B")
+        else:
+            self.sync_status_label.configure(text="")
+    
+    def open_report(self):
+        if self.report_window and self.report_window.winfo_exists():
+            self.report_window.render()
+            self.report_window.focus_force()
+            return
+        self.report_window = ReportWindow(self, self.entry_cache)
+    
+    def on_entry_saved(self, success):
+        if not success:
+            self.connection_label.configure(text="● Offline", text_color="#FF6B6B")
+            self.supabase.connection_monitor.check_now()
+            pending = self.supabase.get_offline_queue_count()
+            self.offline_count_label.configure(text=f"({pending} pending)" if pending > 0 else "")
+        
+        if self.report_window and self.report_window.winfo_exists():
+            # Saved entries are pulled into the cache; queued ones are merged in directly
+            if success:
+                self.report_window.refresh()
+            else:
+                self.report_window.render()
+        
+        self.update_sync_status()
+    
+    def show_no_files_message(self):
+        self.total_files_label.configure(text="Files: 0")
+        self.files_container.set_items([])
     
     def add_files(self):
         files = filedialog.askopenfilenames(
@@ -231,45 +324,89 @@ class MainWindow(ctk.CTk):
         )
         
         if files:
-            for file_path in files:
-                self.add_single_file(file_path)
+            clients = self.path_parser.extract_clients(files)
+            with self.session.batch():
+                for file_path, client_name in zip(files, clients):
+                    self.add_single_file(file_path, client_name)
             
             self.open_next_btn.configure(state="normal")
             self.update_display()
     
-    def add_single_file(self, file_path):
-        client_name = self.path_parser.extract_client_from_path(file_path)
-        filename = os.path.basename(file_path)
-        short_filename = filename[:25] + "..." if len(filename) > 25 else filename
-        
-        file_data = {
-            'path': file_path,
-            'filename': filename,
-            'short_filename': short_filename,
-            'client': client_name,
-            'display_text': f"{client_name} - {short_filename}",
-            'is_active': False,
-            'is_paused': False,
-            'is_opened': False,
-            'elapsed_time': 0,
-            'timer_id': None,
-            'start_time': None,
-            'completed': False,
-            'pause_count': 0,
-            'idle_time': 0
-        }
-        
-        self.files.append(file_data)
+    def add_folder(self):
+        if self.importing_folder:
+            return
+        
+        folder = filedialog.askdirectory(title="Select folder")
+        if not folder:
+            return
+        
+        self.importing_folder = True
+        self.add_folder_btn.configure(state="disabled", text="IMPORTING...")
+        threading.Thread(target=self.scan_folder, args=(folder,), daemon=True).start()
+    
+    def scan_folder(self, folder):
+        # Runs on a worker thread: walking and client parsing stay off the UI thread,
+        # and each batch is handed back through after() to be added in one go
+        try:
+            seen = set()
+            for batch in iter_batches(iter_files(folder), batch_size=500):
+                paths = []
+                for file_path in batch:
+                    key = normalize_path(file_path)
+                    if key not in seen:
+                        seen.add(key)
+                        paths.append(file_path)
+                
+                items = list(zip(paths, self.path_parser.extract_clients(paths)))
+                self.after(0, lambda items=items: self.add_import_batch(items))
+        except Exception as e:
+            print(f"Error importing folder: {e}")
+        finally:
+            self.after(0, self.finish_folder_import)
+    
+    def add_import_batch(self, items):
+        added = 0
+        with self.session.batch():
+            for file_path, client_name in items:
+                if self.add_single_file(file_path, client_name):
+                    added += 1
+        
+        if added:
+            self.open_next_btn.configure(state="normal")
+            self.update_display()
+    
+    def finish_folder_import(self):
+        self.importing_folder = False
+        if hasattr(self, 'add_folder_btn'):
+            self.add_folder_btn.configure(state="normal", text="+ ADD FOLDER")
+    
+    def add_single_file(self, file_path, client_name=None):
+        # Files already in the list are skipped; returns whether the file was added
+        key = normalize_path(file_path)
+        if key in self.file_paths:
+            return False
+        
+        if client_name is None:
+            client_name = self.path_parser.extract_client_from_path(file_path)
+        
+        file_data = FileRecord(self.session.new_id(), file_path, client_name)
+        self.session.add(file_data)
+        self.file_paths.add(key)
+        self.file_watcher.watch(file_path)
+        return True
     
     def clean_all_files(self):
         result = messagebox.askyesno("Confirm", "Are you sure you want to remove all files?")
         if result:
-            for file_data in self.files:
-                if file_data['timer_id']:
-                    self.after_cancel(file_data['timer_id'])
+            for file_data in self.session:
+                if not file_data.completed:
+                    self.file_watcher.unwatch(file_data.path)
             
-            self.files = []
-            self.active_file_index = None
+            self.session.clear()
+            self.file_paths.clear()
+            if self.idle_detector:
+                self.idle_detector.set_active_file(None)
+                self.idle_detector.clear_files()
             self.client_colors = {}
             self.color_index = 0
             
@@ -280,120 +417,39 @@ class MainWindow(ctk.CTk):
                 self.tray_icon.close_minimized_panel()
     
     def remove_single_file(self, file_data):
-        if file_data['timer_id']:
-            self.after_cancel(file_data['timer_id'])
-        
-        idx = self.files.index(file_data)
-        self.files.remove(file_data)
+        was_active = self.session.active_id == file_data.id
+        if not self.session.remove(file_data):
+            return
+        if not file_data.completed:
+            self.file_paths.discard(normalize_path(file_data.path))
+            self.file_watcher.unwatch(file_data.path)
+        if self.idle_detector:
+            self.idle_detector.discard_file(file_data.id)
         
-        if self.active_file_index is not None:
-            if self.active_file_index == idx:
-                self.active_file_index = None
-            elif self.active_file_index > idx:
-                self.active_file_index -= 1
+        if was_active and self.idle_detector:
+            self.idle_detector.set_active_file(None)
         
         self.update_display()
         
-        if not self.files:
+        if not self.session:
             self.open_next_btn.configure(state="disabled")
     
     def update_display(self):
-        for widget in self.files_container.winfo_children():
-            widget.destroy()
-        
-        if not self.files:
+        if not self.session:
             self.show_no_files_message()
             return
         
-        active_files = [f for f in self.files if not f['completed']]
-        self.total_files_label.configure(text=f"Files: {len(active_files)}")
+        items = self.session.visible()
         
-        for i, file_data in enumerate(self.files):
-            if file_data['completed']:
-                continue
-                
-            self.create_file_row(file_data, i)
-    
-    def create_file_row(self, file_data, index):
-        file_frame = ctk.CTkFrame(self.files_container)
-        file_frame.pack(fill="x", pady=2, padx=5)
-        
-        client_color = self.get_client_color(file_data['client'])
-        
-        order_label = ctk.CTkLabel(file_frame, text=f"{index+1}.", width=30)
-        order_label.pack(side="left", padx=5)
-        
-        name_label = ctk.CTkLabel(file_frame, text=file_data['display_text'], 
-                                 anchor="w", width=250, text_color=client_color)
-        name_label.pack(side="left", padx=10, fill="x", expand=True)
-        
-        btn_frame = ctk.CTkFrame(file_frame)
-        btn_frame.pack(side="right", padx=5)
-        
-        if file_data['is_active']:
-            if file_data['is_paused']:
-                name_label.configure(text=f"⏸ {file_data['display_text']}", text_color="#FFA500")
-            else:
-                name_label.configure(text=f"● {file_data['display_text']}", text_color="#2E8B57")
-            
-            timer_label = ctk.CTkLabel(btn_frame, text="00:00", width=60)
-            timer_label.pack(side="left", padx=2)
-            file_data['timer_label'] = timer_label
-            
-            elapsed = file_data['elapsed_time']
-            if not file_data['is_paused'] and file_data['start_time']:
-                elapsed += (datetime.now() - file_data['start_time']).total_seconds()
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
-            timer_label.configure(text=f"{minutes:02d}:{seconds:02d}")
-            
-            pause_text = "RESUME" if file_data['is_paused'] else "PAUSE"
-            pause_btn = ctk.CTkButton(btn_frame, text=pause_text, width=70,
-                                     command=lambda f=file_data: self.pause_file(f))
-            pause_btn.pack(side="left", padx=2)
-            file_data['pause_btn'] = pause_btn
-            
-            done_btn = ctk.CTkButton(btn_frame, text="DONE", width=70,
-                                    command=lambda f=file_data: self.complete_file(f))
-            done_btn.pack(side="left", padx=2)
-            file_data['done_btn'] = done_btn
-            
-            remove_btn = ctk.CTkButton(btn_frame, text="✕", width=30,
-                                      command=lambda f=file_data: self.remove_single_file(f),
-                                      fg_color="#DC143C",
-                                      hover_color="#B22222")
-            remove_btn.pack(side="left", padx=2)
-            
-            if not file_data['is_paused']:
-                self.update_timer(file_data)
-                
-        else:
-            status_text = "✓ Opened" if file_data['is_opened'] else "Not opened"
-            status_color = "#4CAF50" if file_data['is_opened'] else "#888888"
-            status_label = ctk.CTkLabel(btn_frame, text=status_text, width=70, 
-                                       text_color=status_color, font=ctk.CTkFont(size=11))
-            status_label.pack(side="left", padx=2)
-            
-            start_btn = ctk.CTkButton(btn_frame, text="START", width=70,
-                                     command=lambda f=file_data: self.start_file(f),
-                                     state="normal" if file_data['is_opened'] else "disabled")
-            start_btn.pack(side="left", padx=2)
-            file_data['start_btn'] = start_btn
-            
-            remove_btn = ctk.CTkButton(btn_frame, text="✕", width=30,
-                                      command=lambda f=file_data: self.remove_single_file(f),
-                                      fg_color="#DC143C",
-                                      hover_color="#B22222")
-            remove_btn.pack(side="left", padx=2)
-        
-        file_data['frame'] = file_frame
-        file_data['name_label'] = name_label
+        self.total_files_label.configure(text=f"Files: {len(items)}")
+        self.files_container.set_items(items)
+        self.ticker.restart()
     
     def open_next_file(self):
-        for file_data in self.files:
-            if not file_data['completed'] and not file_data['is_opened']:
-                self.open_file(file_data)
-                return
+        file_data = self.session.next_unopened()
+        if file_data:
+            self.open_file(file_data)
+            return
         
         messagebox.showinfo("Info", "All files are already opened")
     
@@ -411,7 +467,7 @@ class MainWindow(ctk.CTk):
             opened = False
             for ps_path in photoshop_paths:
                 try:
-                    subprocess.Popen([ps_path, file_data['path']])
+                    subprocess.Popen([ps_path, file_data.path])
                     opened = True
                     break
                 except:
@@ -419,54 +475,33 @@ class MainWindow(ctk.CTk):
             
             if not opened:
                 if os.name == 'nt':
-                    os.startfile(file_data['path'])
+                    os.startfile(file_data.path)
                 else:
-                    subprocess.Popen(['xdg-open', file_data['path']])
+                    subprocess.Popen(['xdg-open', file_data.path])
             
-            file_data['is_opened'] = True
+            self.session.mark_opened(file_data)
             self.update_display()
                 
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}")
     
     def start_next_available_file(self, event=None):
-        for file_data in self.files:
-            if not file_data['completed'] and file_data['is_opened'] and not file_data['is_active']:
-                self.start_file(file_data)
-                return
-        
-        for file_data in self.files:
-            if not file_data['completed'] and not file_data['is_opened']:
+        file_data = self.session.next_to_start()
+        if file_data:
+            if not file_data.is_opened:
                 self.open_file(file_data)
-                self.start_file(file_data)
-                return
+            self.start_file(file_data)
     
     def toggle_current_pause(self, event=None):
-        if self.active_file_index is not None:
-            active_file = self.files[self.active_file_index]
-            if active_file['is_active']:
-                self.pause_file(active_file)
+        active_file = self.session.active()
+        if active_file and active_file.is_active:
+            self.pause_file(active_file)
     
     def start_file(self, file_data):
-        for other_file in self.files:
-            if other_file['is_active'] and other_file != file_data:
-                if not other_file['is_paused'] and other_file['start_time']:
-                    other_file['elapsed_time'] += (datetime.now() - other_file['start_time']).total_seconds()
-                
-                if other_file['timer_id']:
-                    self.after_cancel(other_file['timer_id'])
-                    other_file['timer_id'] = None
-                
-                other_file['is_paused'] = True
-                other_file['start_time'] = None
-        
-        file_data['is_active'] = True
-        file_data['is_paused'] = False
-        file_data['start_time'] = datetime.now()
-        self.active_file_index = self.files.index(file_data)
+        self.session.start(file_data)
         
         if self.idle_detector:
-            self.idle_detector.reset()
+            self.idle_detector.set_active_file(file_data.id)
         
         self.update_display()
         
@@ -474,106 +509,102 @@ class MainWindow(ctk.CTk):
             self.tray_icon.update_minimized_panel(self.get_active_file_info())
     
     def pause_file(self, file_data):
-        if file_data['is_active']:
-            if file_data['is_paused']:
-                file_data['is_paused'] = False
-                file_data['start_time'] = datetime.now()
-                if 'pause_btn' in file_data:
-                    file_data['pause_btn'].configure(text="PAUSE")
-                if 'name_label' in file_data:
-                    file_data['name_label'].configure(text=f"● {file_data['display_text']}", text_color="#2E8B57")
-                self.update_timer(file_data)
-            else:
-                if file_data['start_time']:
-                    file_data['elapsed_time'] += (datetime.now() - file_data['start_time']).total_seconds()
-                
-                file_data['is_paused'] = True
-                file_data['start_time'] = None
-                file_data['pause_count'] += 1
-                
-                if file_data['timer_id']:
-                    self.after_cancel(file_data['timer_id'])
-                    file_data['timer_id'] = None
-                
-                if 'pause_btn' in file_data:
-                    file_data['pause_btn'].configure(text="RESUME")
-                if 'name_label' in file_data:
-                    file_data['name_label'].configure(text=f"⏸ {file_data['display_text']}", text_color="#FFA500")
+        if self.session.toggle_pause(file_data):
+            self.files_container.refresh()
+            self.ticker.restart()
             
             if self.is_minimized and hasattr(self.tray_icon, 'minimized_panel'):
                 self.tray_icon.update_minimized_panel(self.get_active_file_info())
     
-    def update_timer(self, file_data):
-        if file_data['is_active'] and not file_data['is_paused']:
-            elapsed = (datetime.now() - file_data['start_time']).total_seconds() + file_data['elapsed_time']
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
+    def get_elapsed(self, file_data, now=None):
+        return self.session.elapsed(file_data, now)
+    
+    def format_elapsed(self, elapsed):
+        minutes = int(elapsed // 60)
+        seconds = int(elapsed % 60)
+        return f"{minutes:02d}:{seconds:02d}"
+    
+    def is_timer_visible(self):
+        return self.is_minimized or self.state() not in ('withdrawn', 'iconic')
+    
+    def on_tick(self, now):
+        # Every running timer is drawn, not just the current file's: a row resumed from
+        # its own button keeps counting while the current file sits paused
+        if not self.session.running:
+            return None
+        
+        active_file = self.session.active()
+        tick_elapsed = None
+        for file_id in self.session.running:
+            file_data = self.session.get(file_id)
+            elapsed = self.get_elapsed(file_data, now)
+            timer_text = self.format_elapsed(elapsed)
             
-            if 'timer_label' in file_data:
-                file_data['timer_label'].configure(text=f"{minutes:02d}:{seconds:02d}")
+            row = self.files_container.row_for(file_data)
+            if row:
+                row.update_timer_text(timer_text)
             
-            file_data['timer_id'] = self.after(1000, lambda: self.update_timer(file_data))
-            
-            if self.is_minimized and hasattr(self.tray_icon, 'minimized_panel'):
-                self.tray_icon.update_timer_display(f"{minutes:02d}:{seconds:02d}")
+            if file_data is active_file:
+                if self.is_minimized and hasattr(self.tray_icon, 'minimized_panel'):
+                    self.tray_icon.update_timer_display(timer_text)
+                tick_elapsed = elapsed
+            elif tick_elapsed is None:
+                tick_elapsed = elapsed
+        
+        # The ticker times its next wake from a running file, the current one when it runs
+        return tick_elapsed
     
     def complete_current_file(self, event=None):
         if self.completing_file:
             return
         
-        if self.active_file_index is not None:
-            active_file = self.files[self.active_file_index]
-            if active_file['is_active']:
-                self.completing_file = True
-                self.complete_file(active_file)
-                self.after(100, lambda: setattr(self, 'completing_file', False))
+        active_file = self.session.active()
+        if active_file and active_file.is_active:
+            self.completing_file = True
+            self.complete_file(active_file)
+            self.after(100, lambda: setattr(self, 'completing_file', False))
     
     def check_file_modification(self, file_path):
+        # Runs on the stat cache's worker thread; returns a Future[bool]
+        return self.stat_cache.submit(file_path, seconds=60)
+    
+    def wait_for_future(self, future, callback, poll_ms=50):
+        if not future.done():
+            self.after(poll_ms, lambda: self.wait_for_future(future, callback, poll_ms))
+            return
+        
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            current_time = datetime.now().timestamp()
-            directory = os.path.dirname(file_path)
-            filename_with_ext = os.path.basename(file_path)
-            filename_without_ext = os.path.splitext(filename_with_ext)[0]
-            
-            files_to_check = [file_path]
-            
-            if os.path.exists(directory):
-                for file in os.listdir(directory):
-                    file_base_name = os.path.splitext(file)[0]
-                    if file_base_name == filename_without_ext:
-                        full_path = os.path.join(directory, file)
-                        if full_path not in files_to_check and os.path.isfile(full_path):
-                            files_to_check.append(full_path)
-            
-            for check_file in files_to_check:
-                try:
-                    if os.path.exists(check_file):
-                        file_modified_time = os.path.getmtime(check_file)
-                        time_diff = current_time - file_modified_time
-                        if time_diff <= 60:
-                            return True
-                except (OSError, PermissionError):
-                    continue
-            
-            return False
-                    
+            result = future.result()
         except Exception as e:
-            print(f"Error checking file modification: {e}")
-            return True
+            print(f"Background task error: {e}")
+            result = None
+        callback(result)
     
     def complete_file(self, file_data):
-        if file_data['completed']:
+        if file_data.completed or file_data.completing:
+            return
+        
+        file_data.completing = True
+        
+        # Only a save the watcher has seen is trusted: polling lags the last Ctrl+S by up to
+        # poll_interval, so "not saved" or "no baseline" is confirmed with a fresh stat
+        if self.file_watcher.was_saved_within(file_data.path, seconds=60):
+            self.finish_complete_file(file_data, True)
             return
         
-        file_path = file_data['path']
-        if not self.check_file_modification(file_path):
+        future = self.check_file_modification(file_data.path)
+        self.wait_for_future(future, lambda modified: self.finish_complete_file(file_data, modified))
+    
+    def finish_complete_file(self, file_data, modified):
+        file_data.completing = False
+        if file_data.completed or self.session.get(file_data.id) is not file_data:
+            return
+        
+        if modified is False:
             result = messagebox.askyesno(
                 "File Not Modified", 
                 f"Warning: File has not been modified in the last 1 minute!\n\n"
-                f"File: {file_data['filename']}\n\n"
+                f"File: {file_data.filename}\n\n"
                 f"Did you save your work?\n\n"
                 f"Click 'Yes' to complete anyway\n"
                 f"Click 'No' to go back and save",
@@ -583,28 +614,25 @@ class MainWindow(ctk.CTk):
             if not result:
                 return
         
-        total_time = file_data['elapsed_time']
-        if file_data['is_active'] and not file_data['is_paused'] and file_data['start_time']:
-            total_time += (datetime.now() - file_data['start_time']).total_seconds()
-        
-        if file_data['timer_id']:
-            self.after_cancel(file_data['timer_id'])
-        
-        idle_time = 0
+        # idle_time holds what a restored file collected before the last restart
+        idle_time = file_data.idle_time
+        was_active = self.session.active_id == file_data.id
         if self.idle_detector:
-            idle_time = self.idle_detector.get_total_idle_time()
-            self.idle_detector.reset()
-        
-        file_data['idle_time'] = idle_time
-        
+            idle_time += self.idle_detector.get_file_idle_time(file_data.id)
+            # DONE on another row leaves the current file's idle ledger running
+            if was_active:
+                self.idle_detector.set_active_file(None)
+            self.idle_detector.discard_file(file_data.id)
+        
+        file_data.idle_time = idle_time
+        file_data.save_count = self.file_watcher.get_save_count(file_data.path)
+        self.file_watcher.unwatch(file_data.path)
+        # A completed file can be added again for another pass
+        self.file_paths.discard(normalize_path(file_data.path))
+        
+        total_time = self.session.complete(file_data)
         self.save_to_supabase(file_data, total_time)
         
-        file_data['completed'] = True
-        file_data['is_active'] = False
-        
-        if 'frame' in file_data:
-            file_data['frame'].destroy()
-        
         self.auto_start_next_file(file_data)
         
         self.update_display()
@@ -617,33 +645,14 @@ class MainWindow(ctk.CTk):
                 self.tray_icon.show_all_files_done()
     
     def auto_start_next_file(self, completed_file):
-        current_index = self.files.index(completed_file)
-        
-        for i in range(current_index + 1, len(self.files)):
-            file_data = self.files[i]
-            if not file_data['completed'] and file_data['is_opened'] and not file_data['is_active']:
-                self.open_file_in_photoshop_and_start(file_data)
-                return
-        
-        for i in range(current_index + 1, len(self.files)):
-            file_data = self.files[i]
-            if not file_data['completed'] and file_data['is_active'] and file_data['is_paused']:
-                self.start_file(file_data)
-                return
-        
-        for i in range(0, len(self.files)):
-            file_data = self.files[i]
-            if not file_data['completed'] and file_data['is_active'] and file_data['is_paused']:
-                self.start_file(file_data)
-                return
+        next_file, open_first = self.session.next_after(completed_file)
+        if not next_file:
+            return
         
-        for i in range(0, len(self.files)):
-            file_data = self.files[i]
-            if not file_data['completed'] and not file_data['is_active']:
-                if not file_data['is_opened']:
-                    self.open_file(file_data)
-                self.start_file(file_data)
-                return
+        if open_first:
+            self.open_file_in_photoshop_and_start(next_file)
+        else:
+            self.start_file(next_file)
     
     def open_file_in_photoshop_and_start(self, file_data):
         self.open_file(file_data)
@@ -655,16 +664,18 @@ class MainWindow(ctk.CTk):
                 'employee_name': self.get_employee_name(),
                 'work_type': self.worktype_var.get(),
                 'shift': self.shift_var.get(),
-                'client_name': file_data['client'],
-                'filename': file_data['filename'],
-                'file_path': os.path.dirname(file_data['path']),
+                'client_name': file_data.client,
+                'filename': file_data.filename,
+                'file_path': os.path.dirname(file_data.path),
                 'time_spent_seconds': int(total_time),
                 'completed_at': datetime.now().isoformat(),
-                'pause_count': file_data.get('pause_count', 0),
-                'total_idle_seconds': file_data.get('idle_time', 0)
+                'pause_count': file_data.pause_count,
+                'total_idle_seconds': file_data.idle_time,
+                'save_count': file_data.save_count
             }
             
-            self.supabase.insert_time_entry(data)
+            self.supabase.insert_time_entry(data, callback=self.on_entry_saved)
+            self.update_sync_status()
             
         except Exception as e:
             print(f"Error saving to Supabase: {e}")
@@ -679,24 +690,27 @@ class MainWindow(ctk.CTk):
             messagebox.showinfo("Info", "No active file to minimize")
     
     def get_active_file_info(self):
-        if self.active_file_index is not None:
-            file_data = self.files[self.active_file_index]
-            if file_data['is_active']:
-                elapsed = file_data['elapsed_time']
-                if not file_data['is_paused'] and file_data['start_time']:
-                    elapsed += (datetime.now() - file_data['start_time']).total_seconds()
-                
-                minutes = int(elapsed // 60)
-                seconds = int(elapsed % 60)
-                
-                return {
-                    'filename': file_data['display_text'],
-                    'timer_text': f"{minutes:02d}:{seconds:02d}",
-                    'is_paused': file_data['is_paused']
-                }
+        file_data = self.session.active()
+        if file_data and file_data.is_active:
+            return {
+                'filename': file_data.display_text,
+                'timer_text': self.format_elapsed(self.get_elapsed(file_data)),
+                'is_paused': file_data.is_paused
+            }
         return None
     
     def on_closing(self):
+        self.ticker.stop()
         if self.idle_detector:
             self.idle_detector.stop()
+            # Idle time so far goes into the checkpoint, so a resumed file keeps it
+            for file_data in self.session:
+                if not file_data.completed:
+                    file_data.idle_time += self.idle_detector.get_file_idle_time(file_data.id)
+        self.session.save_all()
+        if self.session.store:
+            self.session.store.close()
+        self.supabase.shutdown()
+        self.file_watcher.stop()
+        self.stat_cache.shutdown()
         self.destroy()
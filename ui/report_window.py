@@ -0,0 +1,100 @@
+import customtkinter as ctk
+import threading
+from datetime import datetime, timedelta
+
+class ReportWindow(ctk.CTkToplevel):
+    def __init__(self, main_window, entry_cache):
+        super().__init__(main_window)
+        
+        self.main_window = main_window
+        self.entry_cache = entry_cache
+        
+        self.title("My Report")
+        self.geometry("460x420")
+        self.attributes('-topmost', True)
+        
+        top_frame = ctk.CTkFrame(self)
+        top_frame.pack(fill="x", padx=10, pady=10)
+        
+        self.range_var = ctk.StringVar(value="Today")
+        range_selector = ctk.CTkSegmentedButton(top_frame, values=["Today", "This Week"],
+                                                variable=self.range_var,
+                                                command=lambda _: self.render())
+        range_selector.pack(side="left", padx=5)
+        
+        self.status_label = ctk.CTkLabel(top_frame, text="", font=ctk.CTkFont(size=10))
+        self.status_label.pack(side="right", padx=5)
+        
+        self.summary_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=14, weight="bold"))
+        self.summary_label.pack(anchor="w", padx=15)
+        
+        self.report_box = ctk.CTkTextbox(self, font=ctk.CTkFont(family="Courier", size=12))
+        self.report_box.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Cached numbers show straight away; the pull for newer entries happens behind them
+        self.render()
+        self.refresh()
+    
+    def get_range(self):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.range_var.get() == "This Week":
+            start = today - timedelta(days=today.weekday())
+            return start, start + timedelta(days=7)
+        return today, today + timedelta(days=1)
+    
+    def refresh(self):
+        self.status_label.configure(text="Updating...")
+        
+        def worker():
+            pulled = self.entry_cache.refresh(self.main_window.supabase)
+            try:
+                self.after(0, lambda: self.on_refreshed(pulled))
+            except Exception:
+                # Window closed while the pull was running
+                pass
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def on_refreshed(self, pulled):
+        if not self.winfo_exists():
+            return
+        self.status_label.configure(text=f"Updated {datetime.now().strftime('%H:%M')}")
+        if pulled:
+            self.render()
+    
+    def render(self):
+        start, end = self.get_range()
+        pending = self.main_window.supabase.load_offline_queue()
+        totals = self.entry_cache.totals(start, end, pending)
+        
+        by_client = {}
+        by_shift = {}
+        for (client_name, shift), (count, seconds, idle) in totals.items():
+            for group, key in ((by_client, client_name or "Unknown"), (by_shift, shift or "Unknown")):
+                bucket = group.setdefault(key, [0, 0, 0])
+                bucket[0] += count
+                bucket[1] += seconds
+                bucket[2] += idle
+        
+        total_files = sum(bucket[0] for bucket in by_client.values())
+        total_seconds = sum(bucket[1] for bucket in by_client.values())
+        self.summary_label.configure(text=f"{total_files} files | {self.format_duration(total_seconds)}")
+        
+        lines = [f"{'CLIENT':<24}{'FILES':>6}{'TIME':>10}{'IDLE':>10}"]
+        for client_name, (count, seconds, idle) in sorted(by_client.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{client_name[:23]:<24}{count:>6}{self.format_duration(seconds):>10}{self.format_duration(idle):>10}")
+        
+        lines.append("")
+        lines.append(f"{'SHIFT':<24}{'FILES':>6}{'TIME':>10}{'IDLE':>10}")
+        for shift, (count, seconds, idle) in sorted(by_shift.items()):
+            lines.append(f"{shift[:23]:<24}{count:>6}{self.format_duration(seconds):>10}{self.format_duration(idle):>10}")
+        
+        self.report_box.configure(state="normal")
+        self.report_box.delete("1.0", "end")
+        self.report_box.insert("1.0", "\n".join(lines))
+        self.report_box.configure(state="disabled")
+    
+    def format_duration(self, seconds):
+        hours = int(seconds // 3600)
+        minutes = int(seconds % 3600 // 60)
+        return f"{hours}h {minutes:02d}m"
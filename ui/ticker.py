@@ -0,0 +1,38 @@
+import time
+
+class Ticker:
+    def __init__(self, widget, on_tick, is_visible=None, idle_interval_ms=5000):
+        self.widget = widget
+        self.on_tick = on_tick
+        self.is_visible = is_visible
+        self.idle_interval_ms = idle_interval_ms
+        self.after_id = None
+    
+    def start(self):
+        if self.after_id is None:
+            self.after_id = self.widget.after(0, self._tick)
+    
+    def stop(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+    
+    def restart(self):
+        self.stop()
+        self.start()
+    
+    def _tick(self):
+        self.after_id = None
+        
+        # on_tick returns the running elapsed seconds, or None when nothing is running
+        elapsed = self.on_tick(time.monotonic())
+        if elapsed is None:
+            return
+        
+        if self.is_visible and not self.is_visible():
+            delay_ms = self.idle_interval_ms
+        else:
+            # Wake just after the next whole second so mm:ss never skips or repeats
+            delay_ms = int((1 - (elapsed % 1)) * 1000) + 5
+        
+        self.after_id = self.widget.after(delay_ms, self._tick)
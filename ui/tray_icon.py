@@ -59,7 +59,7 @@ class TrayIcon:
             full_btn.pack(side="left", padx=3)
     
     def update_timer_display(self, timer_text):
-        if self.timer_label:
+        if self.timer_label and self.timer_label.cget("text") != timer_text:
             self.timer_label.configure(text=timer_text)
     
     def update_minimized_panel(self, active_file_info):
@@ -109,8 +109,8 @@ class TrayIcon:
             self.main_window.is_minimized = False
     
     def toggle_pause(self):
-        if hasattr(self.main_window, 'active_file_index') and self.main_window.active_file_index is not None:
-            active_file = self.main_window.files[self.main_window.active_file_index]
+        active_file = self.main_window.session.active()
+        if active_file:
             self.main_window.pause_file(active_file)
     
     def complete_current(self, event=None):
@@ -123,3 +123,4 @@ class TrayIcon:
             self.minimized_panel = None
         self.main_window.is_minimized = False
         self.main_window.deiconify()
+        self.main_window.ticker.restart()
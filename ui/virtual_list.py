@@ -0,0 +1,132 @@
+import math
+import customtkinter as ctk
+
+from ui.file_row import FileRow
+
+class VirtualFileList(ctk.CTkFrame):
+    def __init__(self, parent, main_window, row_height=40, overscan=4, empty_text=""):
+        super().__init__(parent)
+        
+        self.main_window = main_window
+        self.row_height = row_height
+        self.overscan = overscan
+        self.items = []
+        self.offset = 0
+        self.pool = []
+        self.bound_rows = {}
+        
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.empty_label = ctk.CTkLabel(self.viewport, text=empty_text,
+                                       font=ctk.CTkFont(size=14))
+        
+        self.viewport.bind('<Configure>', lambda e: self.render())
+        self.bind_all('<MouseWheel>', self.on_mousewheel, add="+")
+        self.bind_all('<Button-4>', self.on_mousewheel, add="+")
+        self.bind_all('<Button-5>', self.on_mousewheel, add="+")
+    
+    def set_items(self, items):
+        # items is an ordered list of (file_data, display_index) tuples
+        self.items = items
+        self._clamp_offset()
+        self.render()
+    
+    def refresh(self):
+        self.render()
+    
+    def row_for(self, file_data):
+        return self.bound_rows.get(file_data.id)
+    
+    def render(self):
+        if not self.items:
+            for row in self.pool:
+                row.unbind()
+                row.frame.place_forget()
+            self.bound_rows = {}
+            self.empty_label.place(relx=0.5, y=50, anchor="n")
+            self._update_scrollbar()
+            return
+        
+        self.empty_label.place_forget()
+        
+        viewport_height = max(self.viewport.winfo_height(), self.row_height)
+        first = max(0, int(self.offset // self.row_height) - self.overscan)
+        last = min(len(self.items),
+                   int(self.offset // self.row_height) + math.ceil(viewport_height / self.row_height) + self.overscan)
+        visible = self.items[first:last]
+        
+        # Keep rows already showing a still-visible file, recycle the rest
+        wanted = {file_data.id for file_data, _ in visible}
+        free_rows = []
+        bound_rows = {}
+        for key, row in self.bound_rows.items():
+            if key in wanted:
+                bound_rows[key] = row
+            else:
+                free_rows.append(row)
+        free_rows.extend(row for row in self.pool if row.file_data is None)
+        
+        for position, (file_data, display_index) in enumerate(visible, start=first):
+            key = file_data.id
+            row = bound_rows.get(key)
+            if row is None:
+                row = free_rows.pop() if free_rows else self._create_row()
+                bound_rows[key] = row
+            row.update(file_data, display_index)
+            row.frame.place(x=0, y=position * self.row_height - self.offset, relwidth=1)
+        
+        for row in free_rows:
+            row.unbind()
+            row.frame.place_forget()
+        
+        self.bound_rows = bound_rows
+        self._update_scrollbar()
+    
+    def _create_row(self):
+        row = FileRow(self.main_window, self.viewport, height=self.row_height - 4)
+        self.pool.append(row)
+        return row
+    
+    def _content_height(self):
+        return len(self.items) * self.row_height
+    
+    def _clamp_offset(self):
+        max_offset = max(0, self._content_height() - self.viewport.winfo_height())
+        self.offset = min(max(0, self.offset), max_offset)
+    
+    def _update_scrollbar(self):
+        total = self._content_height()
+        if total <= 0:
+            self.scrollbar.set(0, 1)
+            return
+        top = self.offset / total
+        bottom = (self.offset + self.viewport.winfo_height()) / total
+        self.scrollbar.set(top, min(1, bottom))
+    
+    def scroll_to(self, offset):
+        self.offset = offset
+        self._clamp_offset()
+        self.render()
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * self._content_height())
+        elif action == 'scroll':
+            step = self.viewport.winfo_height() if unit == 'pages' else self.row_height
+            self.scroll_to(self.offset + int(amount) * step)
+    
+    def on_mousewheel(self, event):
+        if not str(event.widget).startswith(str(self)):
+            return
+        
+        if getattr(event, 'num', None) == 4:
+            direction = -1
+        elif getattr(event, 'num', None) == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + direction * 3 * self.row_height)
@@ -0,0 +1,95 @@
+import json
+import os
+import re
+
+class PathTrieNode:
+    __slots__ = ('children', 'client')
+    
+    def __init__(self):
+        self.children = {}
+        self.client = None
+
+class PathTrie:
+    def __init__(self):
+        self.root = PathTrieNode()
+        self.size = 0
+    
+    @staticmethod
+    def split(path):
+        normalized = path.replace('/', '\\').rstrip('\\').casefold()
+        return normalized.split('\\')
+    
+    def insert(self, path, client):
+        node = self.root
+        for part in self.split(path):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = PathTrieNode()
+            node = child
+        if node.client is None:
+            self.size += 1
+        node.client = client
+    
+    def longest_prefix(self, parts):
+        # Walks at most len(parts) nodes no matter how many mappings are loaded
+        node = self.root
+        client = None
+        for part in parts:
+            node = node.children.get(part.casefold())
+            if node is None:
+                break
+            if node.client is not None:
+                client = node.client
+        return client
+
+class ClientRuleEngine:
+    def __init__(self, config_file="data/client_rules.json"):
+        self.config_file = config_file
+        self.trie = PathTrie()
+        self.patterns = []
+        self.loose_fallback = True
+        self.load()
+    
+    def load(self):
+        self.trie = PathTrie()
+        self.patterns = []
+        self.loose_fallback = True
+        
+        if not self.config_file or not os.path.exists(self.config_file):
+            return
+        
+        try:
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+        except Exception as e:
+            print(f"Error loading client rules: {e}")
+            return
+        
+        for directory, client in config.get('mappings', {}).items():
+            self.trie.insert(directory, client)
+        
+        for rule in config.get('patterns', []):
+            try:
+                self.patterns.append((re.compile(rule['pattern']), rule.get('client')))
+            except (re.error, KeyError, TypeError) as e:
+                print(f"Skipping invalid client rule {rule!r}: {e}")
+        
+        self.loose_fallback = config.get('loose_fallback', True)
+    
+    def add_mapping(self, directory, client):
+        self.trie.insert(directory, client)
+    
+    def match_mapping(self, parts):
+        return self.trie.longest_prefix(parts)
+    
+    def match_pattern(self, parts):
+        for pattern, client in self.patterns:
+            for part in parts:
+                match = pattern.fullmatch(part)
+                if match:
+                    if client:
+                        return match.expand(client)
+                    if 'client' in pattern.groupindex:
+                        return match.group('client')
+                    return part
+        return None
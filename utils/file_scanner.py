@@ -0,0 +1,41 @@
+import os
+
+IMAGE_EXTENSIONS = {'.psd', '.psb', '.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp'}
+
+def normalize_path(file_path):
+    return os.path.normcase(os.path.abspath(file_path))
+
+def iter_files(root, extensions=IMAGE_EXTENSIONS, recursive=True):
+    # Depth-first walk that yields matching files in name order, one folder at a time
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name.lower())
+        except OSError as e:
+            print(f"Skipping folder {directory}: {e}")
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirectories.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions:
+                    yield entry.path
+            except OSError:
+                continue
+
+        pending.extend(reversed(subdirectories))
+
+def iter_batches(items, batch_size=500):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,40 +1,75 @@
-import os
-import re
-
-class PathParser:
-    def __init__(self):
-        self.patterns = [
-            r'\\\d{4}_[A-Z]+_[A-Za-z0-9]+\\',  # \0034_TOG_Enhance\
-            r'\\\d{4}_[A-Z]+\\',              # \0034_JH\
-            r'/\d{4}_[A-Z]+_[A-Za-z0-9]+/',   # /0034_TOG_Enhance/
-            r'/\d{4}_[A-Z]+/',                # /0034_JH/
-        ]
-    
-    def extract_client_from_path(self, file_path):
-        # Convert to consistent format
-        normalized_path = file_path.replace('/', '\\')
-        
-        # Try patterns to extract client code
-        for pattern in self.patterns:
-            matches = re.findall(pattern, normalized_path)
-            if matches:
-                # Extract just the client code (0034_JH) from the matched path segment
-                client_match = re.search(r'\d{4}_[A-Z]+(?:_[A-Za-z0-9]+)?', matches[0])
-                if client_match:
-                    return client_match.group()
-        
-        # Fallback: split path and look for pattern
-        path_parts = normalized_path.split('\\')
-        for part in path_parts:
-            # Look for patterns like 0034_JH or 0035_TOG_Enhance
-            if re.match(r'\d{4}_[A-Z]+', part):
-                return part
-            if re.match(r'\d{4}_[A-Z]+_[A-Za-z0-9]+', part):
-                return part
-        
-        # Final fallback: use the folder that contains numbers and letters
-        for part in path_parts:
-            if any(c.isdigit() for c in part) and any(c.isalpha() for c in part):
-                return part
-        
-        return "Unknown_Client"
\ No newline at end of file
+import re
+from functools import lru_cache
+
+from utils.client_rules import ClientRuleEngine
+
+class PathParser:
+    # One pass over the folder names: group 2 is set for 0034_TOG_Enhance, unset for 0034_JH
+    CLIENT_FOLDER = re.compile(r'(\d{4}_[A-Z]+)(_[A-Za-z0-9]+)?')
+    CLIENT_PREFIX = re.compile(r'\d{4}_[A-Z]+')
+    
+    def __init__(self, cache_size=4096, rules=None):
+        self.rules = rules if rules is not None else ClientRuleEngine()
+        self._resolve_directory = lru_cache(maxsize=cache_size)(self._scan_directory)
+    
+    def _scan_directory(self, directory):
+        # Returns (client, fallback) for a normalized directory. The file name is not
+        # part of the key, so every file in the same folder shares one cache entry.
+        parts = directory.split('\\')
+        
+        # Explicit folder mappings first, then configured regex rules
+        client = self.rules.match_mapping(parts) or self.rules.match_pattern(parts)
+        if client:
+            return client, None
+        
+        # Folders with a separator on both sides: the long form wins over the short one
+        short_match = None
+        for part in parts[1:]:
+            match = self.CLIENT_FOLDER.fullmatch(part)
+            if match:
+                if match.group(2):
+                    return part, None
+                if short_match is None:
+                    short_match = part
+        if short_match:
+            return short_match, None
+        
+        for part in parts:
+            if self.CLIENT_PREFIX.match(part):
+                return part, None
+        
+        if self.rules.loose_fallback:
+            for part in parts:
+                if any(c.isdigit() for c in part) and any(c.isalpha() for c in part):
+                    return None, part
+        
+        return None, None
+    
+    def extract_client_from_path(self, file_path):
+        # Convert to consistent format
+        normalized_path = file_path.replace('/', '\\')
+        directory, _, filename = normalized_path.rpartition('\\')
+        
+        client, fallback = self._resolve_directory(directory)
+        if client:
+            return client
+        
+        # The file name itself is only checked after every folder
+        if self.CLIENT_PREFIX.match(filename):
+            return filename
+        if fallback:
+            return fallback
+        if self.rules.loose_fallback and any(c.isdigit() for c in filename) and any(c.isalpha() for c in filename):
+            return filename
+        
+        return "Unknown_Client"
+    
+    def extract_clients(self, file_paths):
+        return [self.extract_client_from_path(file_path) for file_path in file_paths]
+    
+    def reload_rules(self):
+        self.rules.load()
+        self.clear_cache()
+    
+    def clear_cache(self):
+        self._resolve_directory.cache_clear()
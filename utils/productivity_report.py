@@ -0,0 +1,253 @@
+import csv
+
+import numpy as np
+
+from utils.shift_detector import ShiftDetector
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+
+CATEGORY_COLUMNS = ('employee_name', 'client_name', 'work_type', 'shift')
+NUMBER_COLUMNS = ('time_spent_seconds', 'total_idle_seconds', 'pause_count')
+
+class EntryColumns:
+    # time_entries held column-wise: text columns as int32 codes into a label list,
+    # numbers as int64 arrays, plus the hour each entry was completed (-1 if unknown).
+    # 'completed_shift' is derived from that hour with ShiftDetector's schedule.
+    def __init__(self, categories, numbers, hours, shift_detector=None):
+        self.categories = categories
+        self.numbers = numbers
+        self.hours = hours
+        
+        shift_table = (shift_detector or ShiftDetector()).get_hour_table()
+        labels = sorted(set(shift_table))
+        lookup = np.array([labels.index(shift) for shift in shift_table] + [-1], dtype=np.int32)
+        # Unknown hours (-1) index the trailing -1 in the lookup table
+        self.categories['completed_shift'] = (labels, lookup[hours])
+    
+    def __len__(self):
+        return len(self.hours)
+    
+    @classmethod
+    def from_rows(cls, rows, shift_detector=None):
+        # rows: any iterable of dicts, e.g. SupabaseClient.iter_time_entries(...) or csv.DictReader
+        codes = {column: {} for column in CATEGORY_COLUMNS}
+        category_values = {column: [] for column in CATEGORY_COLUMNS}
+        number_values = {column: [] for column in NUMBER_COLUMNS}
+        timestamps = []
+        
+        for row in rows:
+            for column in CATEGORY_COLUMNS:
+                value = row.get(column) or ''
+                column_codes = codes[column]
+                code = column_codes.get(value)
+                if code is None:
+                    code = column_codes[value] = len(column_codes)
+                category_values[column].append(code)
+            for column in NUMBER_COLUMNS:
+                value = row.get(column)
+                number_values[column].append(int(float(value)) if value not in (None, '') else 0)
+            timestamps.append(row.get('completed_at') or '')
+        
+        categories = {column: (list(codes[column]), np.array(category_values[column], dtype=np.int32))
+                      for column in CATEGORY_COLUMNS}
+        numbers = {column: np.array(number_values[column], dtype=np.int64) for column in NUMBER_COLUMNS}
+        return cls(categories, numbers, parse_hours(np.array(timestamps, dtype=str)), shift_detector)
+    
+    @classmethod
+    def from_arrow(cls, table, shift_detector=None):
+        categories = {}
+        for column in CATEGORY_COLUMNS:
+            if column in table.column_names:
+                encoded = table.column(column).cast(pa.string()).fill_null('').combine_chunks().dictionary_encode()
+                categories[column] = (encoded.dictionary.to_pylist(),
+                                      encoded.indices.to_numpy(zero_copy_only=False).astype(np.int32))
+            else:
+                categories[column] = ([''], np.zeros(table.num_rows, dtype=np.int32))
+        
+        numbers = {}
+        for column in NUMBER_COLUMNS:
+            if column in table.column_names:
+                values = table.column(column).cast(pa.float64()).fill_null(0)
+                numbers[column] = values.to_numpy().astype(np.int64)
+            else:
+                numbers[column] = np.zeros(table.num_rows, dtype=np.int64)
+        
+        if 'completed_at' in table.column_names:
+            completed_at = table.column('completed_at')
+            if pa.types.is_timestamp(completed_at.type):
+                hours = parse_hours(completed_at.to_numpy())
+            else:
+                hours = parse_hours(completed_at.cast(pa.string()).fill_null('').to_numpy(zero_copy_only=False).astype(str))
+        else:
+            hours = np.full(table.num_rows, -1, dtype=np.int64)
+        return cls(categories, numbers, hours, shift_detector)
+    
+    @classmethod
+    def from_csv(cls, path, shift_detector=None):
+        if pa is not None:
+            return cls.from_arrow(pa_csv.read_csv(path), shift_detector)
+        with open(path, newline='') as f:
+            return cls.from_rows(csv.DictReader(f), shift_detector)
+    
+    @classmethod
+    def from_parquet(cls, path, shift_detector=None):
+        if pa is None:
+            raise ImportError("Reading Parquet exports requires pyarrow (pip install pyarrow)")
+        return cls.from_arrow(pa_parquet.read_table(path), shift_detector)
+    
+    @classmethod
+    def from_supabase(cls, supabase, shift_detector=None, **filters):
+        columns = list(CATEGORY_COLUMNS + NUMBER_COLUMNS) + ['completed_at']
+        return cls.from_rows(supabase.iter_time_entries(columns=columns, **filters), shift_detector)
+
+def parse_hours(timestamps):
+    # Hour of day for ISO strings or datetime64 values; -1 where it cannot be read
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        moments = timestamps.astype('datetime64[s]')
+    else:
+        # Keep "YYYY-MM-DDTHH:MM:SS" and drop fractions/offsets, then parse in one pass
+        text = timestamps.astype('U19')
+        text = np.where(np.char.str_len(text) >= 13, text, 'NaT')
+        try:
+            moments = text.astype('datetime64[s]')
+        except ValueError:
+            moments = np.array([parse_one(value) for value in text], dtype='datetime64[s]')
+    
+    valid = ~np.isnat(moments)
+    hours = (moments - moments.astype('datetime64[D]')).astype('timedelta64[h]').astype(np.int64)
+    return np.where(valid, hours, -1)
+
+def parse_one(value):
+    try:
+        return np.datetime64(value, 's')
+    except ValueError:
+        return np.datetime64('NaT')
+
+def group_keys(entries, by):
+    # One int64 key per row for the combination of the `by` columns, then dense group ids
+    key = np.zeros(len(entries), dtype=np.int64)
+    key_space = 1
+    for column in by:
+        labels, codes = entries.categories[column]
+        # +1 so the -1 code for an unknown completed_shift still gets its own slot
+        key = key * (len(labels) + 1) + (codes + 1)
+        key_space *= len(labels) + 1
+    
+    if key_space <= 2 * len(key) + 1024:
+        # Small key space: count instead of sorting
+        unique_keys = np.flatnonzero(np.bincount(key, minlength=key_space))
+        remap = np.zeros(key_space, dtype=np.int64)
+        remap[unique_keys] = np.arange(len(unique_keys))
+        return unique_keys, remap[key]
+    
+    unique_keys, group_ids = np.unique(key, return_inverse=True)
+    return unique_keys, group_ids.reshape(-1)
+
+def grouped_percentiles(group_ids, group_count, values, percentiles):
+    # Sorts once on (group, value) packed into a single int64, then reads each group's
+    # percentiles at its offset with numpy's default linear interpolation
+    counts = np.bincount(group_ids, minlength=group_count)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    
+    low = values.min() if len(values) else 0
+    span = int(values.max() - low) + 1 if len(values) else 1
+    if group_count * span < 2 ** 62:
+        packed = np.sort(group_ids.astype(np.int64) * span + (values - low))
+        sorted_values = packed - np.repeat(np.arange(group_count, dtype=np.int64) * span, counts) + low
+    else:
+        sorted_values = values[np.lexsort((values, group_ids))]
+    
+    results = {}
+    for q in percentiles:
+        position = (counts - 1) * (q / 100.0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+        results[q] = sorted_values[starts + lower] * (1 - fraction) + sorted_values[starts + upper] * fraction
+    return results
+
+def group_stats(entries, by=('employee_name',), percentiles=(50, 90)):
+    # One dict per group, sorted by the group labels: the labels plus entries, total_seconds,
+    # mean_seconds, idle_seconds, idle_ratio (idle / tracked time), mean_pauses, and
+    # time_p<q> / pauses_p<q> for every requested percentile
+    if len(entries) == 0:
+        return []
+    
+    unique_keys, group_ids = group_keys(entries, by)
+    group_count = len(unique_keys)
+    
+    time_spent = entries.numbers['time_spent_seconds']
+    idle = entries.numbers['total_idle_seconds']
+    pauses = entries.numbers['pause_count']
+    
+    counts = np.bincount(group_ids, minlength=group_count)
+    total_time = np.bincount(group_ids, weights=time_spent, minlength=group_count)
+    total_idle = np.bincount(group_ids, weights=idle, minlength=group_count)
+    total_pauses = np.bincount(group_ids, weights=pauses, minlength=group_count)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        idle_ratio = np.where(total_time > 0, total_idle / total_time, 0.0)
+    
+    time_percentiles = grouped_percentiles(group_ids, group_count, time_spent, percentiles)
+    pause_percentiles = grouped_percentiles(group_ids, group_count, pauses, percentiles)
+    
+    # Unpack each group key back into its per-column codes
+    label_codes = []
+    remaining = unique_keys.copy()
+    for column in reversed(by):
+        labels, _ = entries.categories[column]
+        base = len(labels) + 1
+        label_codes.append((column, labels, remaining % base - 1))
+        remaining //= base
+    label_codes.reverse()
+    
+    rows = []
+    for group in range(group_count):
+        row = {}
+        for column, labels, codes in label_codes:
+            code = codes[group]
+            row[column] = labels[code] if code >= 0 else None
+        row['entries'] = int(counts[group])
+        row['total_seconds'] = float(total_time[group])
+        row['mean_seconds'] = float(total_time[group] / counts[group])
+        row['idle_seconds'] = float(total_idle[group])
+        row['idle_ratio'] = float(idle_ratio[group])
+        row['mean_pauses'] = float(total_pauses[group] / counts[group])
+        for q in percentiles:
+            row[f'time_p{q}'] = float(time_percentiles[q][group])
+            row[f'pauses_p{q}'] = float(pause_percentiles[q][group])
+        rows.append(row)
+    
+    rows.sort(key=lambda row: tuple('' if row[column] is None else row[column] for column in by))
+    return rows
+
+def shift_breakdown(entries, by=('employee_name',), percentiles=(50, 90)):
+    # Same stats split by the shift each entry was completed in
+    return group_stats(entries, by=tuple(by) + ('completed_shift',), percentiles=percentiles)
+
+def pause_distribution(entries, by=('employee_name',), max_pauses=10):
+    # {group labels: counts of entries with 0, 1, ... max_pauses (and more) pauses}
+    if len(entries) == 0:
+        return {}
+    
+    unique_keys, group_ids = group_keys(entries, by)
+    buckets = np.minimum(entries.numbers['pause_count'], max_pauses)
+    histogram = np.bincount(group_ids * (max_pauses + 1) + buckets,
+                            minlength=len(unique_keys) * (max_pauses + 1)).reshape(len(unique_keys), max_pauses + 1)
+    
+    # Label each group from its first row
+    order = np.argsort(group_ids, kind='stable')
+    first_rows = order[np.searchsorted(group_ids[order], np.arange(len(unique_keys)))]
+    
+    distribution = {}
+    for group, row in enumerate(first_rows):
+        labels = tuple(entries.categories[column][0][entries.categories[column][1][row]]
+                       if entries.categories[column][1][row] >= 0 else None
+                       for column in by)
+        distribution[labels] = histogram[group].tolist()
+    return distribution
@@ -9,15 +9,20 @@ class ShiftDetector:
         }
     
     def get_current_shift(self):
-        current_hour = datetime.now().hour
-        
+        return self.get_shift_for_hour(datetime.now().hour)
+    
+    def get_shift_for_hour(self, hour):
         for shift, (start, end) in self.shift_schedule.items():
             if start < end:
-                if start <= current_hour < end:
+                if start <= hour < end:
                     return shift
             else:
                 # Overnight shift
-                if current_hour >= start or current_hour < end:
+                if hour >= start or hour < end:
                     return shift
         
-        return 'Morning'  # Default fallback
\ No newline at end of file
+        return 'Morning'  # Default fallback
+    
+    def get_hour_table(self):
+        # Shift name for each hour 0-23, for lookups over many timestamps at once
+        return [self.get_shift_for_hour(hour) for hour in range(24)]
\ No newline at end of file